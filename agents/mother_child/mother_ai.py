@@ -4,20 +4,92 @@ Mother는 헌법이자 통제 시스템, Child AI들은 권한/기억 없는 부
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Any, Mapping, Optional, Tuple
 from enum import Enum
 import asyncio
 import json
 import logging
 import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
 import hashlib
+import itertools
+import re
+import struct
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 순수 Python 집계로 대체
+    np = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 제안 수가 이 이상일 때만 NumPy 벡터 연산 사용 (작은 배치는 순수 Python이 더 빠름)
+_VECTORIZE_MIN_PROPOSALS = 32
+
+# Child 분석 결과 상수 - 태스크와 무관하므로 호출마다 새로 만들지 않음
+_REASONING_STEPS: Tuple[str, ...] = (
+    "문제 정의 및 요구사항 분석",
+    "필수 정보 및 제약 조건 식별",
+    "가능한 해결책 탐색",
+    "각 해결책의 장단점 평가",
+    "최적 해결책 선택 및 구체화",
+)
+# 단계의 완성도 기반 신뢰도 (기본 0.8 + 완성도 × 0.04, 최대 0.95)
+_REASONING_CONFIDENCE = min(0.8 + (len(_REASONING_STEPS) / 5.0) * 0.04, 0.95)
+_WEAKNESSES: Tuple[str, ...] = (
+    "정보의 불완전성 가능성",
+    "선행 가정의 명시적 검증 부족",
+    "예외 케이스 고려 미흡",
+    "실행 환경 제약 간과",
+)
+_VERIFY_RESULTS: Tuple[str, ...] = (
+    "내부 논리 일관성 확인",
+    "선행 조건 충족 여부 검증",
+    "결론 도달 과정 타당성",
+)
+_REPRODUCIBILITY_ANALYSIS = "동일 입력 조건에서 결과 안정성 확보 가능성: 높음"
+_VERIFIED_SOLUTION = "검증된 안정적 해결책"
+
+# Child 사고 근거 템플릿 - 정적 부분은 모듈 로드 시 1회 구성
+_REASONING_TEMPLATE = (
+    "태스크: {task}\n\n"
+    "단계적 분석:\n{steps}\n\n"
+    "각 단계의 논리적 연결성을 검증하고,\n"
+    "결론에 도달하기 위한 필수 조건을 식별했습니다."
+)
+_CRITIQUE_TEMPLATE = (
+    "태스크에 대한 비판적 분석:\n\n"
+    "발견된 취약점:\n{weaknesses}\n\n"
+    "잠재적 위험 요소:\n"
+    "논리적 오류 가능성, 정보 부족 영역, 선행 조건 누락"
+)
+_VERIFICATION_TEMPLATE = (
+    "사실성 검증 결과:\n{results}\n\n재현성 분석:\n{reproducibility}"
+)
+
+
+def _is_plain_json(value: Any) -> bool:
+    """
+    JSON 값으로 손실 없이 직렬화되는지 확인 (문자열 키 dict / list / 기본 스칼라만)
+
+    json.dumps는 정수 키를 문자열로 바꾸므로 {1: "a"}와 {"1": "a"}가 같은 직렬화가 됨
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_plain_json(item) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return all(_is_plain_json(item) for item in value)
+    return False
+
 
 class ChildType(Enum):
     """Child AI 유형 분류"""
@@ -39,7 +111,7 @@ class ExecutionAuthority(Enum):
     EXECUTED = "executed"  # 실행 완료
 
 
-@dataclass
+@dataclass(slots=True)
 class ChildProposal:
     """Child AI의 제안"""
 
@@ -51,11 +123,11 @@ class ChildProposal:
     confidence: float
     score: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.time_ns)  # epoch 나노초
 
 
 
-@dataclass
+@dataclass(slots=True)
 class MotherDecision:
     """Mother의 최종 결정"""
 
@@ -68,7 +140,63 @@ class MotherDecision:
     audit_log: Dict[str, Any] = field(default_factory=dict)
     execution_time: float = 0.0
     reproducibility_score: float = 0.0
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)  # epoch 나노초
+    _decision_hash: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def created_at(self) -> datetime:
+        """생성 시각 (datetime 변환은 조회 시에만 수행)"""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+
+    @property
+    def created_at_iso(self) -> str:
+        """감사 조회용 ISO 형식 생성 시각"""
+        return self.created_at.isoformat()
+
+    @property
+    def decision_hash(self) -> str:
+        """결정의 해시 - 재현성 보장 (최초 조회 시 1회 계산)"""
+        if self._decision_hash is None:
+            hasher = hashlib.sha256()
+            hasher.update(self.final_decision.encode())
+            hasher.update(self.reasoning.encode())
+            hasher.update(struct.pack("<d", self.reproducibility_score))
+            self._decision_hash = hasher.hexdigest()[:16]
+        return self._decision_hash
+
+
+@dataclass(slots=True)
+class AuditRecord:
+    """감사 로그 항목 - 결정의 요약만 보관"""
+
+    timestamp: str
+    task_id: str
+    authority: str
+    proposals_count: int
+    execution_time: float
+    reproducibility: float
+    decision_hash: str
+
+
+@lru_cache(maxsize=64)
+def _forbidden_pattern(actions: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """금지 액션 목록을 한 번에 검사하는 정규식 (목록이 바뀔 때만 새로 컴파일)"""
+    if not actions:
+        return None
+    return re.compile("|".join(re.escape(action) for action in actions), re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _find_forbidden(pattern: "re.Pattern[str]", content: str) -> Optional[str]:
+    """
+    콘텐츠 1회 스캔으로 처음 발견된 금지 액션 반환
+
+    (정규식, 콘텐츠) 단위 캐시 - 동일 콘텐츠 재검증 시 스캔 생략, 목록 변경 시 자동 무효화
+    """
+    match = pattern.search(content)
+    return match.group(0) if match else None
 
 
 class SafetyLimit:
@@ -88,9 +216,11 @@ class SafetyLimit:
     def validate_proposal(self, proposal: ChildProposal) -> Tuple[bool, str]:
         """제안 안전성 검증"""
 
-        # 금지된 액션 체크
-        if any(action in proposal.content.lower() for action in self.forbidden_actions):
-            return False, f"금지된 액션 감지: {proposal.content}"
+        # 금지된 액션 체크 (검증 시점의 forbidden_actions 목록 기준 - 실행 중 추가 즉시 반영)
+        pattern = _forbidden_pattern(tuple(self.forbidden_actions))
+        forbidden = _find_forbidden(pattern, proposal.content) if pattern else None
+        if forbidden is not None:
+            return False, f"금지된 액션 감지: {forbidden}"
 
         # 신뢰도 임계값 체크
         if proposal.confidence > self.max_confidence_threshold:
@@ -102,6 +232,11 @@ class SafetyLimit:
 class BaseChildAI(ABC):
     """Child AI 기본 클래스 - 권한/기억 없이 오직 사고만 담당"""
 
+    @staticmethod
+    def _make_child_id(child_type: ChildType, index: int) -> str:
+        """유형 내 순번 기반 Child 식별자 (Mother의 children 키와 동일, UUID 불필요)"""
+        return f"{child_type.value}_{index}"
+
     def __init__(self, child_id: str, child_type: ChildType):
         self.child_id = child_id
         self.child_type = child_type
@@ -134,8 +269,10 @@ class BaseChildAI(ABC):
 class ReasoningChild(BaseChildAI):
     """추론 그룹 - 논리적 해결, 단계적 사고"""
 
-    def __init__(self):
-        super().__init__(f"reasoning_{uuid.uuid4().hex[:8]}", ChildType.REASONING)
+    def __init__(self, index: int = 0):
+        super().__init__(
+            self._make_child_id(ChildType.REASONING, index), ChildType.REASONING
+        )
 
     @property
     def name(self) -> str:
@@ -145,24 +282,19 @@ class ReasoningChild(BaseChildAI):
         # 논리적 단계 분해
         steps = self._decompose_task(task)
 
-        reasoning = f"""
-        태스크: {task}
-        
-        단계적 분석:
-        {chr(10).join([f"{i + 1}. {step}" for i, step in enumerate(steps)])}
-        
-        각 단계의 논리적 연결성을 검증하고, 
-        결론에 도달하기 위한 필수 조건을 식별했습니다.
-        """
+        reasoning = _REASONING_TEMPLATE.format(
+            task=task,
+            steps="\n".join(f"{i}. {step}" for i, step in enumerate(steps, 1)),
+        )
 
-        confidence = self._calculate_confidence(steps)
+        confidence = _REASONING_CONFIDENCE
 
         return ChildProposal(
             id=str(uuid.uuid4()),
             child_id=self.child_id,
             child_type=ChildType.REASONING,
             content=f"논리적 해결책: {self._generate_solution(steps)}",
-            reasoning=reasoning.strip(),
+            reasoning=reasoning,
             confidence=confidence,
             metadata={"steps": steps, "method": "logical_decomposition"},
         )
@@ -173,31 +305,21 @@ class ReasoningChild(BaseChildAI):
         validation_reasoning = "추론 과정의 논리적 일관성이 확인됨"
         return reproducibility, validation_reasoning
 
-    def _decompose_task(self, task: str) -> List[str]:
+    def _decompose_task(self, task: str) -> Tuple[str, ...]:
         # 태스크를 논리적 단계로 분해
-        return [
-            "문제 정의 및 요구사항 분석",
-            "필수 정보 및 제약 조건 식별",
-            "가능한 해결책 탐색",
-            "각 해결책의 장단점 평가",
-            "최적 해결책 선택 및 구체화",
-        ]
+        return _REASONING_STEPS
 
-    def _calculate_confidence(self, steps: List[str]) -> float:
-        # 단계의 완성도 기반 신뢰도 계산
-        base_confidence = 0.8
-        completeness = len(steps) / 5.0
-        return min(base_confidence + completeness * 0.04, 0.95)
-
-    def _generate_solution(self, steps: List[str]) -> str:
+    def _generate_solution(self, steps: Tuple[str, ...]) -> str:
         return f"{len(steps)}단계 논리적 접근을 통한 체계적 해결"
 
 
 class CritiqueChild(BaseChildAI):
     """반박 그룹 - 결과 취약점 탐지, 논리 오류 검증"""
 
-    def __init__(self):
-        super().__init__(f"critique_{uuid.uuid4().hex[:8]}", ChildType.CRITIQUE)
+    def __init__(self, index: int = 0):
+        super().__init__(
+            self._make_child_id(ChildType.CRITIQUE, index), ChildType.CRITIQUE
+        )
 
     @property
     def name(self) -> str:
@@ -207,22 +329,16 @@ class CritiqueChild(BaseChildAI):
         # 제안된 해결책의 취약점 분석
         weaknesses = self._identify_weaknesses(task, context)
 
-        reasoning = f"""
-        태스크에 대한 비판적 분석:
-        
-        발견된 취약점:
-        {chr(10).join([f"- {weakness}" for weakness in weaknesses])}
-        
-        잠재적 위험 요소:
-        논리적 오류 가능성, 정보 부족 영역, 선행 조건 누락
-        """
+        reasoning = _CRITIQUE_TEMPLATE.format(
+            weaknesses="\n".join(f"- {weakness}" for weakness in weaknesses)
+        )
 
         return ChildProposal(
             id=str(uuid.uuid4()),
             child_id=self.child_id,
             child_type=ChildType.CRITIQUE,
             content=f"비판적 개선안: {self._generate_critique(weaknesses)}",
-            reasoning=reasoning.strip(),
+            reasoning=reasoning,
             confidence=0.75,  # 비판적 접근은 보수적 신뢰도
             metadata={"weaknesses": weaknesses, "method": "critical_analysis"},
         )
@@ -233,23 +349,22 @@ class CritiqueChild(BaseChildAI):
         validation_reasoning = "비판적 분석의 객관성과 일관성 확인"
         return critical_consistency, validation_reasoning
 
-    def _identify_weaknesses(self, task: str, context: Dict[str, Any]) -> List[str]:
-        return [
-            "정보의 불완전성 가능성",
-            "선행 가정의 명시적 검증 부족",
-            "예외 케이스 고려 미흡",
-            "실행 환경 제약 간과",
-        ]
+    def _identify_weaknesses(
+        self, task: str, context: Dict[str, Any]
+    ) -> Tuple[str, ...]:
+        return _WEAKNESSES
 
-    def _generate_critique(self, weaknesses: List[str]) -> str:
+    def _generate_critique(self, weaknesses: Tuple[str, ...]) -> str:
         return f"취약점 보완을 통한 강화된 해결책 제안"
 
 
 class VerificationChild(BaseChildAI):
     """검증 그룹 - 사실성 체크, 재현성 검토"""
 
-    def __init__(self):
-        super().__init__(f"verification_{uuid.uuid4().hex[:8]}", ChildType.VERIFICATION)
+    def __init__(self, index: int = 0):
+        super().__init__(
+            self._make_child_id(ChildType.VERIFICATION, index), ChildType.VERIFICATION
+        )
 
     @property
     def name(self) -> str:
@@ -260,20 +375,17 @@ class VerificationChild(BaseChildAI):
         verification_results = self._verify_facts(task)
         reproducibility_analysis = self._analyze_reproducibility(task)
 
-        reasoning = f"""
-        사실성 검증 결과:
-        {chr(10).join([f"- {result}" for result in verification_results])}
-        
-        재현성 분석:
-        {reproducibility_analysis}
-        """
+        reasoning = _VERIFICATION_TEMPLATE.format(
+            results="\n".join(f"- {result}" for result in verification_results),
+            reproducibility=reproducibility_analysis,
+        )
 
         return ChildProposal(
             id=str(uuid.uuid4()),
             child_id=self.child_id,
             child_type=ChildType.VERIFICATION,
             content=f"검증된 해결책: {self._generate_verified_solution()}",
-            reasoning=reasoning.strip(),
+            reasoning=reasoning,
             confidence=0.90,  # 검증 기반 높은 신뢰도
             metadata={
                 "verification_results": verification_results,
@@ -288,18 +400,14 @@ class VerificationChild(BaseChildAI):
         validation_reasoning = "검증 프로세스의 재현성과 정확성 확인"
         return verification_reproducibility, validation_reasoning
 
-    def _verify_facts(self, task: str) -> List[str]:
-        return [
-            "내부 논리 일관성 확인",
-            "선행 조건 충족 여부 검증",
-            "결론 도달 과정 타당성",
-        ]
+    def _verify_facts(self, task: str) -> Tuple[str, ...]:
+        return _VERIFY_RESULTS
 
     def _analyze_reproducibility(self, task: str) -> str:
-        return "동일 입력 조건에서 결과 안정성 확보 가능성: 높음"
+        return _REPRODUCIBILITY_ANALYSIS
 
     def _generate_verified_solution(self) -> str:
-        return "검증된 안정적 해결책"
+        return _VERIFIED_SOLUTION
 
 
 class MotherAI:
@@ -313,12 +421,34 @@ class MotherAI:
         self.safety_limit = SafetyLimit()
         self.children: Dict[str, BaseChildAI] = {}
         self.memory: Dict[str, Any] = {}  # 장기 기억 관리
-        self.audit_log: List[MotherDecision] = []  # 감사 로그
+        self.audit_log: Deque[AuditRecord] = deque(
+            maxlen=config.get("audit_log_max", 10_000)
+        )  # 감사 로그 (링 버퍼)
         self.policy_kernel: Dict[str, Any] = {}  # 정책 커널
 
+        # 동일 (태스크, 컨텍스트) 결정 캐시 (LRU)
+        self._decision_cache: OrderedDict[
+            Tuple[str, str], Tuple[List[ChildProposal], Dict[str, Any]]
+        ] = OrderedDict()
+        self._decision_cache_size = config.get("decision_cache_size", 256)
+        self._decision_cache_enabled = not config.get("disable_decision_cache", False)
+
+        # 감사 로그 출력 백그라운드 기록기 (첫 결정 기록 시 이벤트 루프에서 시작)
+        self._audit_queue: Optional["asyncio.Queue[AuditRecord]"] = None
+        self._audit_writer_task: Optional["asyncio.Task[None]"] = None
+        self._audit_loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Child AI 초기화
         self._initialize_children()
 
+        # 유형별 Child 그룹 및 교차 검증 대표 Child
+        self._children_by_type: Dict[ChildType, List[BaseChildAI]] = {}
+        for child in self.children.values():
+            self._children_by_type.setdefault(child.child_type, []).append(child)
+        self._type_representative: Dict[ChildType, BaseChildAI] = {
+            child_type: group[0] for child_type, group in self._children_by_type.items()
+        }
+
         # 정책 커널 초기화
         self._initialize_policy_kernel()
 
@@ -327,20 +457,32 @@ class MotherAI:
 
         # 추론 그룹 (10개)
         for i in range(10):
-            self.children[f"reasoning_{i}"] = ReasoningChild()
+            child = ReasoningChild(i)
+            self.children[child.child_id] = child
 
         # 비판 그룹 (10개)
         for i in range(10):
-            self.children[f"critique_{i}"] = CritiqueChild()
+            child = CritiqueChild(i)
+            self.children[child.child_id] = child
 
         # 검증 그룹 (10개)
         for i in range(10):
-            self.children[f"verification_{i}"] = VerificationChild()
+            child = VerificationChild(i)
+            self.children[child.child_id] = child
 
         # 기타 Child 그룹 (나머지 30개)
         # 여기에 도메인, 설계, 벤치마크 Child 추가 가능
 
-        logger.info(f"총 {len(self.children)}개의 Child AI 초기화 완료")
+        # 기본 관련 Child 선택 (태스크마다 재구성하지 않도록 1회 계산)
+        self._default_relevant: Mapping[str, BaseChildAI] = MappingProxyType(
+            {
+                child_id: self.children[child_id]
+                for child_id in ("reasoning_0", "critique_0", "verification_0")
+                if child_id in self.children
+            }
+        )
+
+        logger.info("총 %d개의 Child AI 초기화 완료", len(self.children))
 
     def _initialize_policy_kernel(self):
         """정책 커널 초기화 - Mother의 헌법"""
@@ -377,52 +519,27 @@ class MotherAI:
         4. Mother의 최종 결정
         5. 실행 권한 부여/거부
         """
-        start_time = time.time()
+        start_time = time.monotonic_ns()
 
         if context is None:
             context = {}
 
         task_id = str(uuid.uuid4())
-        logger.info(f"Mother AI 태스크 처리 시작: {task_id}")
+        logger.info("Mother AI 태스크 처리 시작: %s", task_id)
 
         try:
-            # 1. Child 그룹별 사고 요청
-            relevant_children = self._select_relevant_children(task)
-            proposals = []
-
-            # 병렬로 Child 사고 실행
-            async_tasks = []
-            for child_id, child in relevant_children.items():
-                async_tasks.append(self._get_child_proposal(child, task, context))
-
-            child_results = await asyncio.gather(*async_tasks, return_exceptions=True)
-
-            for result in child_results:
-                if isinstance(result, ChildProposal):
-                    proposals.append(result)
-                elif isinstance(result, Exception):
-                    logger.error(f"Child 사고 실패: {result}")
-
-            # 2. 안전성 검증
-            safe_proposals = []
-            for proposal in proposals:
-                is_safe, reason = self.safety_limit.validate_proposal(proposal)
-                if is_safe:
-                    proposal.score = self._calculate_proposal_score(proposal)
-                    safe_proposals.append(proposal)
-                else:
-                    logger.warning(f"제안 안전성 검증 실패: {reason}")
-
-            # 3. 교차 검증
-            validated_proposals = await self._cross_validate_proposals(safe_proposals)
-
-            # 4. 합의 형성
-            consensus = self._form_consensus(validated_proposals)
-
-            # 5. Mother의 최종 결정
-            final_decision = await self._make_final_decision(consensus, task, context)
+            cache_key = self._decision_cache_key(task, context)
+            cached = self._decision_cache_get(cache_key)
+            if cached is not None:
+                validated_proposals, final_decision = cached
+                logger.info("결정 캐시 적중: %s", task_id)
+            else:
+                validated_proposals, final_decision = await self._run_pipeline(
+                    task, context
+                )
+                self._decision_cache_put(cache_key, validated_proposals, final_decision)
 
-            execution_time = time.time() - start_time
+            execution_time = (time.monotonic_ns() - start_time) / 1e9
 
             mother_decision = MotherDecision(
                 task_id=task_id,
@@ -438,11 +555,11 @@ class MotherAI:
             # 감사 로그 기록
             self._audit_decision(mother_decision)
 
-            logger.info(f"Mother AI 결정 완료: {mother_decision.authority.value}")
+            logger.info("Mother AI 결정 완료: %s", mother_decision.authority.value)
             return mother_decision
 
         except Exception as e:
-            logger.error(f"태스크 처리 중 오류: {e}")
+            logger.error("태스크 처리 중 오류: %s", e)
             return MotherDecision(
                 task_id=task_id,
                 proposals=[],
@@ -450,25 +567,115 @@ class MotherAI:
                 authority=ExecutionAuthority.DENIED,
                 reasoning=f"처리 오류: {str(e)}",
                 child_contributions={},
-                execution_time=time.time() - start_time,
+                execution_time=(time.monotonic_ns() - start_time) / 1e9,
             )
 
-    def _select_relevant_children(self, task: str) -> Dict[str, BaseChildAI]:
-        """태스크에 관련된 Child AI 선택"""
-        relevant = {}
+    async def _run_pipeline(
+        self, task: str, context: Dict[str, Any]
+    ) -> Tuple[List[ChildProposal], Dict[str, Any]]:
+        """Child 사고 → 안전성 검증 → 교차 검증 → 합의 → 최종 결정"""
+        # 1. Child 그룹별 사고 요청
+        relevant_children = self._select_relevant_children(task)
+
+        # 병렬로 Child 사고 실행
+        async_tasks = []
+        for child_id, child in relevant_children.items():
+            async_tasks.append(self._get_child_proposal(child, task, context))
+
+        # 2. 안전성 검증 - 먼저 도착한 제안부터 검증하여 나머지 Child 사고와 중첩
+        safe_proposals = []
+        for next_proposal in asyncio.as_completed(async_tasks):
+            try:
+                proposal = await next_proposal
+            except Exception as e:
+                logger.error("Child 사고 실패: %s", e)
+                continue
+
+            is_safe, reason = self.safety_limit.validate_proposal(proposal)
+            if is_safe:
+                proposal.metadata["_validated_at"] = time.monotonic()
+                proposal.score = self._calculate_proposal_score(proposal)
+                safe_proposals.append(proposal)
+            else:
+                logger.warning("제안 안전성 검증 실패: %s", reason)
+
+        # 3. 교차 검증 (기본: 전체 제안 검증, early_exit_cross_validation 설정 시 선행 제안만)
+        validated_proposals = await self._cross_validate_proposals(
+            safe_proposals,
+            early_exit=self.config.get("early_exit_cross_validation", False),
+        )
 
-        # 모든 Child를 기본으로 포함 (실제로는 태스크 기반 필터링)
-        sample_children = {
-            "reasoning_0": self.children.get("reasoning_0"),
-            "critique_0": self.children.get("critique_0"),
-            "verification_0": self.children.get("verification_0"),
-        }
+        # 4. 합의 형성
+        consensus = self._form_consensus(validated_proposals)
 
-        for child_id, child in sample_children.items():
-            if child:
-                relevant[child_id] = child
+        # 5. Mother의 최종 결정
+        final_decision = await self._make_final_decision(consensus, task, context)
 
-        return relevant
+        return validated_proposals, final_decision
+
+    def _decision_cache_key(
+        self, task: str, context: Dict[str, Any]
+    ) -> Optional[Tuple[str, str]]:
+        """
+        결정 캐시 키 계산 (태스크, 컨텍스트 해시)
+
+        JSON으로 손실 없이 표현되지 않는 컨텍스트(문자열이 아닌 키, 임의 객체 등)는
+        서로 다른 값이 같은 키가 될 수 있으므로 캐시하지 않음 (None - 파이프라인 실행)
+        """
+        if not self._decision_cache_enabled:
+            return None
+        try:
+            if not _is_plain_json(context):
+                return None
+            serialized = json.dumps(context, sort_keys=True)
+        except (TypeError, ValueError, RecursionError):  # 순환 참조 등 직렬화 불가
+            return None
+        context_hash = hashlib.sha256(serialized.encode()).hexdigest()[:16]
+        return task, context_hash
+
+    def _decision_cache_get(
+        self, key: Optional[Tuple[str, str]]
+    ) -> Optional[Tuple[List[ChildProposal], Dict[str, Any]]]:
+        """캐시된 결정 조회 - 감사 로그와 공유되지 않도록 사본 반환"""
+        if key is None or key not in self._decision_cache:
+            return None
+        self._decision_cache.move_to_end(key)
+        proposals, final_decision = self._decision_cache[key]
+        final_decision = dict(final_decision)
+        final_decision["contributions"] = dict(final_decision["contributions"])
+        return self._copy_proposals(proposals), final_decision
+
+    @staticmethod
+    def _copy_proposals(proposals: List[ChildProposal]) -> List[ChildProposal]:
+        """
+        제안 사본 목록 (점수/metadata를 결정 간에 공유하지 않도록 제안마다 복사)
+
+        캐시 저장 시와 조회 시 모두 복사하여 반환된 결정의 제안을 수정해도 캐시에 영향 없음
+        """
+        return [
+            replace(proposal, metadata=dict(proposal.metadata)) for proposal in proposals
+        ]
+
+    def _decision_cache_put(
+        self,
+        key: Optional[Tuple[str, str]],
+        proposals: List[ChildProposal],
+        final_decision: Dict[str, Any],
+    ):
+        """결정 캐시 저장 (LRU 초과 시 가장 오래된 항목 제거)"""
+        if key is None:
+            return
+        final_decision = dict(final_decision)
+        final_decision["contributions"] = dict(final_decision["contributions"])
+        self._decision_cache[key] = (self._copy_proposals(proposals), final_decision)
+        self._decision_cache.move_to_end(key)
+        while len(self._decision_cache) > self._decision_cache_size:
+            self._decision_cache.popitem(last=False)
+
+    def _select_relevant_children(self, task: str) -> Mapping[str, BaseChildAI]:
+        """태스크에 관련된 Child AI 선택"""
+        # 모든 Child를 기본으로 포함 (실제로는 태스크 기반 필터링)
+        return self._default_relevant
 
     async def _get_child_proposal(
         self, child: BaseChildAI, task: str, context: Dict[str, Any]
@@ -478,7 +685,7 @@ class MotherAI:
             proposal = await child.think(task, context)
             return proposal
         except Exception as e:
-            logger.error(f"Child {child.child_id} 사고 실패: {e}")
+            logger.error("Child %s 사고 실패: %s", child.child_id, e)
             raise
 
     def _calculate_proposal_score(self, proposal: ChildProposal) -> float:
@@ -493,28 +700,60 @@ class MotherAI:
         return 0.8  # 시뮬레이션된 점수
 
     async def _cross_validate_proposals(
-        self, proposals: List[ChildProposal]
+        self, proposals: List[ChildProposal], early_exit: bool = False
     ) -> List[ChildProposal]:
-        """제안들 간 교차 검증"""
-        validated_proposals = []
+        """
+        제안들 간 교차 검증
+        early_exit이면 점수 순으로 검증하여 처음 통과한 제안(선행 제안)에서 중단
+        (반환 제안/Child 기여도가 선행 제안 하나로 줄어듦 - 명시적으로 설정한 경우에만 사용)
+        """
+        if not early_exit:
+            return await self._cross_validate_batch(proposals)
 
-        for proposal in proposals:
-            reproducibility_scores = []
+        for proposal in sorted(proposals, key=lambda p: p.score, reverse=True):
+            validated = await self._cross_validate_batch([proposal])
+            if validated:
+                return validated
+        return []
 
-            # 다른 Child들로부터 교차 검증 받기
-            for other_child_id, other_child in self.children.items():
-                if other_child.child_type != proposal.child_type:
-                    try:
-                        reproducibility, _ = await other_child.cross_validate(proposal)
-                        reproducibility_scores.append(reproducibility)
-                    except Exception as e:
-                        logger.error(f"교차 검증 실패: {e}")
+    async def _cross_validate_batch(
+        self, proposals: List[ChildProposal]
+    ) -> List[ChildProposal]:
+        """제안 묶음 교차 검증 - 재현성 임계값을 통과한 제안 반환"""
+        # 전체 제안 × 다른 유형 대표 Child의 교차 검증을 한 번에 병렬 실행
+        # (같은 유형의 Child는 동일한 검증 결과를 내므로 그룹 크기로 가중)
+        index: List[Tuple[int, ChildType]] = []
+        coros = []
+        for i, proposal in enumerate(proposals):
+            for child_type, representative in self._type_representative.items():
+                if child_type != proposal.child_type:
+                    index.append((i, child_type))
+                    coros.append(representative.cross_validate(proposal))
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+
+        if np is not None and len(proposals) >= _VECTORIZE_MIN_PROPOSALS:
+            weighted_sums, total_weights = self._aggregate_validations_vectorized(
+                len(proposals), index, results
+            )
+        else:
+            weighted_sums = [0.0] * len(proposals)
+            total_weights = [0] * len(proposals)
+            for (i, child_type), result in zip(index, results):
+                if isinstance(result, Exception):
+                    logger.error("교차 검증 실패: %s", result)
+                    continue
+                weight = len(self._children_by_type[child_type])
+                weighted_sums[i] += result[0] * weight
+                total_weights[i] += weight
 
+        validated_proposals = []
+        for proposal, weighted_sum, total_weight in zip(
+            proposals, weighted_sums, total_weights
+        ):
             # 재현성 점수 평균
-            if reproducibility_scores:
-                avg_reproducibility = sum(reproducibility_scores) / len(
-                    reproducibility_scores
-                )
+            if total_weight:
+                avg_reproducibility = weighted_sum / total_weight
                 proposal.metadata["cross_validation_score"] = avg_reproducibility
 
                 # 재현성 임계값 통과 시만 포함
@@ -523,25 +762,58 @@ class MotherAI:
 
         return validated_proposals
 
+    def _aggregate_validations_vectorized(
+        self,
+        num_proposals: int,
+        index: List[Tuple[int, ChildType]],
+        results: List[Any],
+    ) -> Tuple[List[float], List[float]]:
+        """교차 검증 결과를 제안별 가중합/가중치로 집계 (NumPy bincount)"""
+        positions = []
+        scores = []
+        weights = []
+        for (i, child_type), result in zip(index, results):
+            if isinstance(result, Exception):
+                logger.error("교차 검증 실패: %s", result)
+                continue
+            positions.append(i)
+            scores.append(result[0])
+            weights.append(len(self._children_by_type[child_type]))
+
+        position_arr = np.asarray(positions, dtype=np.intp)
+        weight_arr = np.asarray(weights, dtype=np.float64)
+        weighted_sums = np.bincount(
+            position_arr,
+            weights=np.asarray(scores, dtype=np.float64) * weight_arr,
+            minlength=num_proposals,
+        )
+        total_weights = np.bincount(
+            position_arr, weights=weight_arr, minlength=num_proposals
+        )
+        return weighted_sums.tolist(), total_weights.tolist()
+
     def _form_consensus(self, proposals: List[ChildProposal]) -> Dict[str, Any]:
         """Child 간 합의 형성"""
         if not proposals:
             return {"consensus_strength": 0, "majority_decision": ""}
 
-        # 점수 기반 순위
-        sorted_proposals = sorted(proposals, key=lambda p: p.score, reverse=True)
+        # 최고 점수 제안 선택 (단일 패스, 전체 정렬 불필요)
+        if np is not None and len(proposals) >= _VECTORIZE_MIN_PROPOSALS:
+            scores = np.fromiter(
+                (p.score for p in proposals), dtype=np.float64, count=len(proposals)
+            )
+            best_proposal = proposals[int(scores.argmax())]
+        else:
+            best_proposal = max(proposals, key=lambda p: p.score)
 
         # 최고 점수 제안의 합의 강도 계산
-        best_proposal = sorted_proposals[0]
-        consensus_strength = (
-            best_proposal.score / max(p.score for p in proposals) if proposals else 0
-        )
+        consensus_strength = 1.0 if best_proposal.score else 0
 
         return {
             "consensus_strength": consensus_strength,
             "majority_decision": best_proposal.content,
             "leading_proposal": best_proposal,
-            "all_proposals": sorted_proposals,
+            "all_proposals": proposals,
         }
 
     async def _make_final_decision(
@@ -563,9 +835,9 @@ class MotherAI:
                 "reproducibility": 0.0,
             }
 
-        # 안전 정책 검증
+        # 안전 정책 검증 (2단계에서 이미 검증된 제안은 재검증 생략)
         leading_proposal = consensus.get("leading_proposal")
-        if leading_proposal:
+        if leading_proposal and not leading_proposal.metadata.get("_validated_at"):
             is_safe, safety_reason = self.safety_limit.validate_proposal(
                 leading_proposal
             )
@@ -600,26 +872,66 @@ class MotherAI:
         }
 
     def _audit_decision(self, decision: MotherDecision):
-        """결정 감사 로그 기록"""
-        audit_entry = {
-            "timestamp": decision.created_at.isoformat(),
-            "task_id": decision.task_id,
-            "authority": decision.authority.value,
-            "proposals_count": len(decision.proposals),
-            "execution_time": decision.execution_time,
-            "reproducibility": decision.reproducibility_score,
-            "decision_hash": self._calculate_decision_hash(decision),
-        }
+        """
+        결정 감사 로그 기록
+        메모리 기록은 즉시 수행 (get_audit_trail 즉시 반영), 로그 출력만 백그라운드 기록기에 위임
+        """
+        audit_entry = AuditRecord(
+            timestamp=decision.created_at_iso,
+            task_id=decision.task_id,
+            authority=decision.authority.value,
+            proposals_count=len(decision.proposals),
+            execution_time=decision.execution_time,
+            reproducibility=decision.reproducibility_score,
+            decision_hash=decision.decision_hash,
+        )
 
-        self.audit_log.append(decision)
+        self.audit_log.append(audit_entry)
 
         # 로그 파일 저장 (실제 구현)
-        logger.info(f"감사 로그 기록: {audit_entry}")
-
-    def _calculate_decision_hash(self, decision: MotherDecision) -> str:
-        """결정의 해시 계산 - 재현성 보장"""
-        decision_string = f"{decision.final_decision}{decision.reasoning}{decision.reproducibility_score}"
-        return hashlib.sha256(decision_string.encode()).hexdigest()[:16]
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._audit_loop is not loop or self._audit_writer_task.done():
+            self._audit_queue = asyncio.Queue()
+            self._audit_writer_task = loop.create_task(self._audit_writer())
+            self._audit_loop = loop
+
+        self._audit_queue.put_nowait(audit_entry)
+
+    async def _audit_writer(self):
+        """감사 로그 기록기 - 큐에서 감사 항목을 꺼내 로그로 출력"""
+        queue = self._audit_queue
+        while True:
+            audit_entry = await queue.get()
+            try:
+                logger.info("감사 로그 기록: %s", audit_entry)
+            except Exception as e:
+                logger.error("감사 로그 기록 실패: %s", e)
+            finally:
+                queue.task_done()
+
+    async def flush_audit_log(self):
+        """대기 중인 감사 로그 출력 완료까지 대기"""
+        if (
+            self._audit_queue is not None
+            and self._audit_loop is asyncio.get_running_loop()
+        ):
+            await self._audit_queue.join()
+
+    async def shutdown(self):
+        """감사 로그를 모두 기록한 뒤 백그라운드 기록기 종료"""
+        await self.flush_audit_log()
+        if self._audit_writer_task is not None:
+            self._audit_writer_task.cancel()
+            try:
+                await self._audit_writer_task
+            except asyncio.CancelledError:
+                pass
+            self._audit_writer_task = None
+            self._audit_queue = None
+            self._audit_loop = None
 
     def get_memory(self, key: str) -> Any:
         """기억 접근 - Mother 전용"""
@@ -633,12 +945,14 @@ class MotherAI:
         """감사 추적 조회"""
         return [
             {
-                "timestamp": decision.created_at.isoformat(),
-                "authority": decision.authority.value,
-                "proposals": len(decision.proposals),
-                "reproducibility": decision.reproducibility_score,
+                "timestamp": record.timestamp,
+                "authority": record.authority,
+                "proposals": record.proposals_count,
+                "reproducibility": record.reproducibility,
             }
-            for decision in self.audit_log[-limit:]
+            for record in itertools.islice(
+                self.audit_log, max(0, len(self.audit_log) - limit), None
+            )
         ]
 
 
@@ -4,18 +4,66 @@ Agent_Local과 Agent의 기능을 결합한 하이브리드 AI 에이전트 시
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import AsyncIterator, ClassVar, Deque, Dict, List, Any, Optional, Union, Tuple
 from enum import Enum
 import asyncio
 import json
 import logging
+import random
 import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 태스크 프롬프트 템플릿 - 정적 부분은 모듈 로드 시 1회 구성
+_PROMPT_TEMPLATE = """당신은 MetaLife OS의 통합 AI 에이전트입니다.
+
+태스크 유형: {task_type}
+설명: {description}
+
+컨텍스트: {context}
+
+요청사항을 완수하기 위한 구체적인 단계와 결과물을 제공해주세요.
+"""
+
+# 툴 실행 결과를 반영한 후속 프롬프트 (채팅 모드 스트리밍 응답용)
+_TOOL_RESULTS_TEMPLATE = """{prompt}
+툴 실행 결과:
+{results}
+
+위 툴 실행 결과를 반영하여 최종 답변을 작성해주세요.
+"""
+
+
+def _dumps_pretty(value: Any) -> str:
+    """들여쓰기된 JSON 직렬화 (orjson 우선, 실패 시 표준 json)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:  # orjson 미지원 타입 (64비트 초과 정수 등)
+            pass
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+def _freeze(value: Any) -> Any:
+    """컨텍스트를 해시 가능한 형태로 변환 (타입 포함, 순서 유지)"""
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
 
 class AgentType(Enum):
     LOCAL = "local"  # Agent_Local: 100% 로컬 처리
@@ -33,7 +81,7 @@ class TaskType(Enum):
     AUTOMATION = "automation"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTask:
     """AI 에이전트 태스크 정의"""
 
@@ -45,8 +93,12 @@ class AgentTask:
     agent_type: Optional[AgentType] = None
     tools: List[str] = field(default_factory=list)
 
+    def __hash__(self) -> int:
+        # context/tools는 변경 가능하므로 태스크 ID 기준으로 해시
+        return hash(self.id)
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentResponse:
     """AI 에이전트 응답 정의"""
 
@@ -62,6 +114,10 @@ class AgentResponse:
 class BaseProvider(ABC):
     """LLM 제공자 기본 클래스"""
 
+    # 동시 요청 수 / 분당 요청 수 제한 (configure_limits 호출 전에는 제한 없음)
+    _concurrency: Optional[asyncio.Semaphore] = None
+    _rate_limiter = None
+
     @abstractmethod
     async def generate(self, prompt: str, **kwargs) -> str:
         pass
@@ -76,20 +132,210 @@ class BaseProvider(ABC):
     def get_model_info(self) -> Dict[str, Any]:
         pass
 
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """응답 스트리밍 (기본 구현: 전체 생성 후 한 번에 반환)"""
+        yield await self.generate(prompt, **kwargs)
+
+    def is_available(self) -> bool:
+        """요청 가능 여부 (서킷 브레이커가 열린 제공자는 False)"""
+        return True
+
+    def configure_limits(
+        self, max_concurrency: int = 16, requests_per_minute: Optional[int] = None
+    ):
+        """제공자 API 호출 제한 설정 (레이트 리밋 초과로 인한 429 폭주 방지)"""
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        if requests_per_minute:
+            try:
+                from aiolimiter import AsyncLimiter
+            except ImportError:
+                raise ImportError("분당 요청 제한에는 aiolimiter 패키지 필요")
+            self._rate_limiter = AsyncLimiter(requests_per_minute, 60)
+
+    @asynccontextmanager
+    async def _limited(self):
+        """API 호출 1회 동안 제한 슬롯 점유"""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        if self._concurrency is None:
+            yield
+            return
+        async with self._concurrency:
+            yield
+
+    async def aclose(self):
+        """제공자 리소스 정리"""
+        return None
+
+
+class HTTPProvider(BaseProvider):
+    """HTTP API 기반 제공자 - 요청 간 커넥션(keep-alive) 재사용"""
+
+    _httpx = None  # 첫 사용 시 임포트한 httpx 모듈 (클래스 공유)
+
+    # 재시도 (지수 백오프 + 지터)
+    max_attempts = 4
+    retry_initial_wait = 1.0
+    retry_max_wait = 10.0
+    retry_status_codes = frozenset({429, 500, 502, 503, 504})
+
+    # 서킷 브레이커: failure_window초 내 failure_threshold회 실패 시 cooldown초 동안 차단
+    failure_threshold = 5
+    failure_window = 60.0
+    cooldown = 30.0
+
+    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None):
+        self.base_url = base_url.rstrip("/")
+        self._headers = headers or {}
+        self._http_client = None
+        self._failure_times: Deque[float] = deque()
+        self._open_until = 0.0
+
+    @staticmethod
+    def _load_httpx():
+        """httpx 지연 임포트 (모듈 객체는 모든 HTTP 제공자가 공유)"""
+        if HTTPProvider._httpx is None:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError("httpx 패키지 필요")
+            HTTPProvider._httpx = httpx
+        return HTTPProvider._httpx
+
+    def _get_http_client(self):
+        """공유 httpx.AsyncClient 획득 (지연 생성)"""
+        if self._http_client is None:
+            httpx = self._load_httpx()
+            self._http_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(120),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                headers={"Accept-Encoding": "gzip", **self._headers},
+            )
+        return self._http_client
+
+    async def _post_json(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        httpx = self._load_httpx()
+        client = self._get_http_client()
 
-class OpenAIProvider(BaseProvider):
+        for attempt in range(self.max_attempts):
+            try:
+                # 백오프 대기 중에는 슬롯을 반납하도록 시도 단위로 점유
+                async with self._limited():
+                    response = await client.post(path, json=payload)
+                response.raise_for_status()
+                result = response.json()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in self.retry_status_codes:
+                    raise  # 요청 자체의 오류 (4xx)는 재시도/장애 집계 대상 아님
+                error = e
+            except httpx.TimeoutException as e:
+                error = e
+            except httpx.TransportError:
+                self._record_failure()  # 연결 실패는 재시도 없이 장애로 집계
+                raise
+            else:
+                self._failure_times.clear()
+                self._open_until = 0.0
+                return result
+
+            if attempt + 1 < self.max_attempts:
+                wait = min(
+                    self.retry_initial_wait * 2**attempt + random.uniform(0, 1),
+                    self.retry_max_wait,
+                )
+                logger.warning(
+                    f"{type(self).__name__} 요청 실패 ({error}), {wait:.1f}초 후 재시도"
+                )
+                await asyncio.sleep(wait)
+
+        self._record_failure()
+        raise error
+
+    async def _stream_lines(
+        self, path: str, payload: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """스트리밍 응답을 줄 단위로 반환 (스트림 도중 재시도는 하지 않음)"""
+        client = self._get_http_client()
+        async with self._limited():
+            async with client.stream("POST", path, json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line:
+                        yield line
+
+    async def _stream_chat_completions(
+        self, payload: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """OpenAI 호환 /chat/completions SSE 스트림에서 텍스트 조각 추출"""
+        async for line in self._stream_lines(
+            "/chat/completions", {**payload, "stream": True}
+        ):
+            if not line.startswith("data: "):
+                continue
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                break
+            for choice in json.loads(data).get("choices", []):
+                text = choice.get("delta", {}).get("content")
+                if text:
+                    yield text
+
+    def _record_failure(self):
+        now = time.monotonic()
+        self._failure_times.append(now)
+        window_start = now - self.failure_window
+        while self._failure_times and self._failure_times[0] < window_start:
+            self._failure_times.popleft()
+
+        if len(self._failure_times) >= self.failure_threshold:
+            self._open_until = now + self.cooldown
+            self._failure_times.clear()
+            logger.warning(
+                f"{type(self).__name__} 서킷 오픈: {self.cooldown:.0f}초 동안 제외"
+            )
+
+    def is_available(self) -> bool:
+        # 쿨다운이 지나면 다시 요청 허용 (half-open) - 실패 시 재집계
+        return time.monotonic() >= self._open_until
+
+    async def aclose(self):
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
+class OpenAIProvider(HTTPProvider):
     """OpenAI API 제공자"""
 
-    def __init__(self, api_key: str, model: str = "gpt-4"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        base_url: str = "https://api.openai.com/v1",
+    ):
+        super().__init__(base_url, {"Authorization": f"Bearer {api_key}"})
         self.api_key = api_key
         self.model = model
-        # 실제 구현에서는 openai 라이브러리 임포트
 
     async def generate(self, prompt: str, **kwargs) -> str:
-        # OpenAI API 호출 구현
         logger.info(f"OpenAI 생성 요청: {len(prompt)} 문자")
-        # return await openai.ChatCompletion.create(...)
-        return f"OpenAI 응답: {prompt[:50]}..."
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            **kwargs,
+        }
+        data = await self._post_json("/chat/completions", payload)
+        return data["choices"][0]["message"]["content"]
+
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            **kwargs,
+        }
+        async for text in self._stream_chat_completions(payload):
+            yield text
 
     async def generate_with_tools(
         self, prompt: str, tools: List[Dict]
@@ -122,12 +368,22 @@ class GeminiProvider(BaseProvider):
         self._client = None
         self._initialized = False
 
+    _genai = None  # 첫 사용 시 임포트한 google.generativeai 모듈 (클래스 공유)
+
+    @classmethod
+    def _load_genai(cls):
+        """google-generativeai 지연 임포트 (모듈 객체는 클래스에 보관)"""
+        if cls._genai is None:
+            import google.generativeai as genai
+            cls._genai = genai
+        return cls._genai
+
     def _init_client(self):
         """Gemini 클라이언트 초기화"""
         if self._initialized:
             return
         try:
-            import google.generativeai as genai
+            genai = self._load_genai()
             genai.configure(api_key=self.api_key)
             self._client = genai.GenerativeModel(
                 model_name=self.model,
@@ -143,13 +399,18 @@ class GeminiProvider(BaseProvider):
 
     async def generate(self, prompt: str, **kwargs) -> str:
         self._init_client()
-        import asyncio
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, lambda: self._client.generate_content(prompt)
-        )
+        async with self._limited():
+            response = await self._client.generate_content_async(prompt)
         return response.text
 
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        self._init_client()
+        async with self._limited():
+            response = await self._client.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+
     async def generate_with_tools(
         self, prompt: str, tools: List[Dict]
     ) -> Tuple[str, List[Dict]]:
@@ -166,20 +427,30 @@ class GeminiProvider(BaseProvider):
 
 
 
-class OllamaProvider(BaseProvider):
+class OllamaProvider(HTTPProvider):
     """Ollama 로컬 LLM 제공자"""
 
     def __init__(
         self, base_url: str = "http://localhost:11434", model: str = "deepseek-r1:14b"
     ):
-        self.base_url = base_url
+        super().__init__(base_url)
         self.model = model
 
     async def generate(self, prompt: str, **kwargs) -> str:
-        # Ollama API 호출 구현
         logger.info(f"Ollama 생성 요청: {self.model}")
-        # return await requests.post(f"{self.base_url}/api/generate", ...)
-        return f"Ollama({self.model}) 응답: {prompt[:50]}..."
+        payload = {"model": self.model, "prompt": prompt, "stream": False, **kwargs}
+        data = await self._post_json("/api/generate", payload)
+        return data["response"]
+
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        # Ollama 스트림은 줄 단위 JSON (NDJSON)
+        payload = {"model": self.model, "prompt": prompt, "stream": True, **kwargs}
+        async for line in self._stream_lines("/api/generate", payload):
+            chunk = json.loads(line)
+            if chunk.get("response"):
+                yield chunk["response"]
+            if chunk.get("done"):
+                break
 
     async def generate_with_tools(
         self, prompt: str, tools: List[Dict]
@@ -197,18 +468,32 @@ class OllamaProvider(BaseProvider):
         }
 
 
-class GLMProvider(BaseProvider):
+class GLMProvider(HTTPProvider):
     """GLM-4.7 제공자 (Z.ai)"""
 
     def __init__(self, api_key: str, base_url: str = "https://api.z.ai/api/paas/v4"):
+        super().__init__(base_url, {"Authorization": f"Bearer {api_key}"})
         self.api_key = api_key
-        self.base_url = base_url
         self.model = "glm-4.7"
 
     async def generate(self, prompt: str, **kwargs) -> str:
         logger.info(f"GLM-4.7 생성 요청")
-        # GLM API 호출 구현
-        return f"GLM-4.7 응답: {prompt[:50]}..."
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            **kwargs,
+        }
+        data = await self._post_json("/chat/completions", payload)
+        return data["choices"][0]["message"]["content"]
+
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            **kwargs,
+        }
+        async for text in self._stream_chat_completions(payload):
+            yield text
 
     async def generate_with_tools(
         self, prompt: str, tools: List[Dict]
@@ -228,15 +513,9 @@ class GLMProvider(BaseProvider):
 class BaseTool(ABC):
     """에이전트 툴 기본 클래스"""
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        pass
-
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        pass
+    # 서브클래스에서 클래스 속성으로 지정 (프로퍼티 디스크립터 호출 없음)
+    name: ClassVar[str]
+    description: ClassVar[str]
 
     @abstractmethod
     async def execute(self, **kwargs) -> Dict[str, Any]:
@@ -246,18 +525,13 @@ class BaseTool(ABC):
 class WebBrowserTool(BaseTool):
     """웹 브라우징 툴 (Agent_Local 기반)"""
 
+    name: ClassVar[str] = "web_browser"
+    description: ClassVar[str] = "웹사이트를 탐색하고 정보를 추출합니다"
+
     def __init__(self, headless: bool = True, stealth: bool = True):
         self.headless = headless
         self.stealth = stealth
 
-    @property
-    def name(self) -> str:
-        return "web_browser"
-
-    @property
-    def description(self) -> str:
-        return "웹사이트를 탐색하고 정보를 추출합니다"
-
     async def execute(self, **kwargs) -> Dict[str, Any]:
         url = kwargs.get("url")
         search_query = kwargs.get("search_query")
@@ -288,6 +562,7 @@ class WebBrowserTool(BaseTool):
 
     async def _visit_page(self, url: str) -> Dict[str, Any]:
         # Selenium 브라우저 자동화 구현
+        # (selenium은 이 메서드 안에서만 지연 임포트 - 모듈 로드 시 임포트 금지)
         logger.info(f"페이지 방문: {url}")
         return {
             "success": True,
@@ -300,17 +575,12 @@ class WebBrowserTool(BaseTool):
 class CodeGenerationTool(BaseTool):
     """코드 생성 툴 (Agent 기반)"""
 
+    name: ClassVar[str] = "code_generation"
+    description: ClassVar[str] = "다양한 언어의 코드를 생성하고 수정합니다"
+
     def __init__(self, provider: BaseProvider):
         self.provider = provider
 
-    @property
-    def name(self) -> str:
-        return "code_generation"
-
-    @property
-    def description(self) -> str:
-        return "다양한 언어의 코드를 생성하고 수정합니다"
-
     async def execute(self, **kwargs) -> Dict[str, Any]:
         language = kwargs.get("language", "python")
         description = kwargs.get("description", "")
@@ -326,10 +596,8 @@ class CodeGenerationTool(BaseTool):
         code = await self.provider.generate(prompt)
 
         if file_path:
-            # 파일 저장 로직
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(code)
+            # 파일 저장은 스레드에서 수행 (이벤트 루프 블로킹 방지)
+            await asyncio.to_thread(self._save_code, file_path, code)
 
         return {
             "success": True,
@@ -338,21 +606,22 @@ class CodeGenerationTool(BaseTool):
             "file_path": file_path,
         }
 
+    @staticmethod
+    def _save_code(file_path: str, code: str):
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(code, encoding="utf-8")
+
 
 class GitHubTool(BaseTool):
     """GitHub 자동화 툴"""
 
+    name: ClassVar[str] = "github"
+    description: ClassVar[str] = "GitHub 저장소를 관리하고 PR을 생성합니다"
+
     def __init__(self, token: str):
         self.token = token
 
-    @property
-    def name(self) -> str:
-        return "github"
-
-    @property
-    def description(self) -> str:
-        return "GitHub 저장소를 관리하고 PR을 생성합니다"
-
     async def execute(self, **kwargs) -> Dict[str, Any]:
         action = kwargs.get("action")
 
@@ -400,7 +669,13 @@ class MetaLifeAgent:
         self.config = config
         self.providers: Dict[str, BaseProvider] = {}
         self.tools: Dict[str, BaseTool] = {}
-        self.task_queue = asyncio.Queue()
+        self._tool_schemas: Dict[str, Dict[str, Any]] = {}
+        self._context_json_cache: OrderedDict = OrderedDict()
+        # 크기 제한 큐 - 과부하 시 생산자가 대기 (백프레셔)
+        self.task_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=config.get("task_queue_size", 1024)
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.running = False
 
         # 제공자 초기화
@@ -438,6 +713,59 @@ class MetaLifeAgent:
             )
             logger.info("Gemini Provider 초기화 완료")
 
+        # 제공자별 호출 제한 (분당 요청 수는 "<이름>_rpm" 설정 시에만 적용)
+        for name, provider in self.providers.items():
+            provider.configure_limits(
+                max_concurrency=self.config.get("max_concurrency", 16),
+                requests_per_minute=self.config.get(f"{name}_rpm"),
+            )
+
+        # 응답 캐시 (정확 일치 + 선택적 의미 일치)
+        # 샘플링 생성(temperature > 0)의 응답도 재사용하므로 명시적으로 켠 경우에만 사용
+        self.response_cache = None
+        if self.config.get("cache_enabled", False):
+            try:
+                from agents.shared.providers.cache import ResponseCache
+            except ImportError as e:  # 패키지 외부에서 단독 실행 시
+                logger.warning(f"응답 캐시 비활성화: {e}")
+            else:
+                self.response_cache = ResponseCache(
+                    max_entries=self.config.get("cache_max_entries", 1024),
+                    semantic=self.config.get("cache_semantic", False),
+                    cache_dir=self.config.get("cache_dir"),
+                )
+                for provider in self.providers.values():
+                    self.response_cache.wrap(provider)
+
+        self._build_dispatch()
+
+    def _build_dispatch(self):
+        """(태스크 유형, 에이전트 타입)별 제공자 우선순위 테이블 구성"""
+        # 기본 전략: Gemini 우선 (비용 효율), 그 다음 로컬, OpenAI
+        fallback_order = ("gemini", "ollama", "openai", "glm")
+
+        self._dispatch: Dict[
+            Tuple[TaskType, Optional[AgentType]], Tuple[str, ...]
+        ] = {}
+        for task_type in TaskType:
+            for agent_type in (*AgentType, None):
+                order: List[str] = []
+                # 코드 생성은 GLM 우선
+                if task_type == TaskType.CODE_GENERATION:
+                    order.append("glm")
+                # 에이전트 타입 명시적 지정
+                if agent_type == AgentType.LOCAL:
+                    order.extend(("ollama", *fallback_order))
+                elif agent_type == AgentType.CLOUD:
+                    # 클라우드: Gemini 우선, 그 다음 OpenAI (다른 제공자로 넘어가지 않음)
+                    order.extend(("gemini", "openai"))
+                else:
+                    order.extend(fallback_order)
+
+                # 중복 제거 후 등록된 제공자만 유지
+                self._dispatch[(task_type, agent_type)] = tuple(
+                    name for name in dict.fromkeys(order) if name in self.providers
+                )
 
     def _initialize_tools(self):
         """툴 초기화"""
@@ -456,9 +784,14 @@ class MetaLifeAgent:
         if self.config.get("github_token"):
             self.tools["github"] = GitHubTool(self.config["github_token"])
 
+        # 툴 스키마는 불변이므로 1회만 생성
+        self._tool_schemas = {
+            name: self._tool_to_schema(tool) for name, tool in self.tools.items()
+        }
+
     async def process_task(self, task: AgentTask) -> AgentResponse:
         """태스크 처리 메인 로직"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # 적절한 제공자 선택
@@ -471,39 +804,28 @@ class MetaLifeAgent:
                     content="",
                     metadata={},
                     error="사용 가능한 LLM 제공자가 없습니다",
-                    execution_time=time.time() - start_time,
+                    execution_time=time.perf_counter() - start_time,
                 )
 
-            # 필요한 툴 선택
-            available_tools = [
-                self.tools[tool_name]
-                for tool_name in task.tools
-                if tool_name in self.tools
-            ]
+            # 필요한 툴 스키마 선택
+            tool_schemas = self._task_tool_schemas(task)
 
             # 프롬프트 구성
             prompt = self._build_prompt(task)
 
-            if available_tools:
+            if tool_schemas:
                 # 툴과 함께 생성
-                tool_schemas = [self._tool_to_schema(tool) for tool in available_tools]
                 content, tool_calls = await provider.generate_with_tools(
                     prompt, tool_schemas
                 )
 
-                # 툴 실행
-                tool_results = []
-                for tool_call in tool_calls:
-                    tool_name = tool_call.get("function", {}).get("name")
-                    if tool_name in self.tools:
-                        result = await self.tools[tool_name].execute(
-                            **tool_call.get("function", {}).get("arguments", {})
-                        )
-                        tool_results.append(result)
+                # 툴 병렬 실행
+                tool_results, tool_errors = await self._execute_tool_calls(tool_calls)
 
                 metadata = {
                     "tool_calls": len(tool_calls),
                     "tool_results": tool_results,
+                    "tool_errors": tool_errors,
                     "provider": provider.get_model_info(),
                 }
             else:
@@ -511,7 +833,10 @@ class MetaLifeAgent:
                 content = await provider.generate(prompt)
                 metadata = {"provider": provider.get_model_info()}
 
-            execution_time = time.time() - start_time
+            if self.response_cache is not None:
+                metadata["cache"] = self.response_cache.stats()
+
+            execution_time = time.perf_counter() - start_time
 
             return AgentResponse(
                 task_id=task.id,
@@ -529,45 +854,75 @@ class MetaLifeAgent:
                 content="",
                 metadata={},
                 error=str(e),
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
             )
 
-    def _select_provider(self, task: AgentTask) -> Optional[BaseProvider]:
-        """태스크에 적합한 제공자 선택"""
-
-        # 코드 생성은 GLM 우선
-        if task.type == TaskType.CODE_GENERATION and "glm" in self.providers:
-            return self.providers["glm"]
+    def _task_tool_schemas(self, task: AgentTask) -> List[Dict[str, Any]]:
+        """태스크가 요청한 툴 중 등록된 툴의 스키마"""
+        return [
+            self._tool_schemas[tool_name]
+            for tool_name in task.tools
+            if tool_name in self._tool_schemas
+        ]
+
+    async def _execute_tool_calls(
+        self, tool_calls: List[Dict[str, Any]]
+    ) -> Tuple[List[Any], List[str]]:
+        """LLM이 요청한 툴 호출 병렬 실행 (반환: (결과 목록, 오류 메시지 목록))"""
+        tool_coros = []
+        for tool_call in tool_calls:
+            tool_name = tool_call.get("function", {}).get("name")
+            if tool_name in self.tools:
+                tool_coros.append(
+                    self.tools[tool_name].execute(
+                        **tool_call.get("function", {}).get("arguments", {})
+                    )
+                )
 
-        # 에이전트 타입 명시적 지정
-        if task.agent_type == AgentType.LOCAL and "ollama" in self.providers:
-            return self.providers["ollama"]
-        elif task.agent_type == AgentType.CLOUD:
-            # 클라우드: Gemini 우선, 그 다음 OpenAI
-            return self.providers.get("gemini") or self.providers.get("openai")
+        tool_results = []
+        tool_errors = []
+        for result in await asyncio.gather(*tool_coros, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"툴 실행 실패: {result}")
+                tool_errors.append(str(result))
+            else:
+                tool_results.append(result)
+        return tool_results, tool_errors
 
-        # 기본 전략: Gemini 우선 (비용 효율), 그 다음 로컬, OpenAI
-        return (
-            self.providers.get("gemini")
-            or self.providers.get("ollama")
-            or self.providers.get("openai")
-            or self.providers.get("glm")
-        )
+    def _select_provider(self, task: AgentTask) -> Optional[BaseProvider]:
+        """태스크에 적합한 제공자 선택"""
 
+        for name in self._dispatch[(task.type, task.agent_type)]:
+            provider = self.providers[name]
+            if provider.is_available():  # 서킷이 열린 제공자는 건너뜀
+                return provider
+        return None
 
     def _build_prompt(self, task: AgentTask) -> str:
         """태스크 기반 프롬프트 구성"""
 
-        base_prompt = f"""당신은 MetaLife OS의 통합 AI 에이전트입니다.
-
-태스크 유형: {task.type.value}
-설명: {task.description}
-
-컨텍스트: {json.dumps(task.context, ensure_ascii=False, indent=2)}
+        return _PROMPT_TEMPLATE.format(
+            task_type=task.type.value,
+            description=task.description,
+            context=self._context_json(task.context),
+        )
 
-요청사항을 완수하기 위한 구체적인 단계와 결과물을 제공해주세요.
-"""
-        return base_prompt
+    def _context_json(self, context: Dict[str, Any]) -> str:
+        """컨텍스트 JSON 직렬화 (동일 컨텍스트 반복 시 캐시 재사용)"""
+        try:
+            key = _freeze(context)
+            cached = self._context_json_cache.get(key)
+        except TypeError:  # 해시 불가능한 값 포함 시 캐시 생략
+            return _dumps_pretty(context)
+
+        if cached is None:
+            cached = _dumps_pretty(context)
+            self._context_json_cache[key] = cached
+            if len(self._context_json_cache) > 256:
+                self._context_json_cache.popitem(last=False)
+        else:
+            self._context_json_cache.move_to_end(key)
+        return cached
 
     def _tool_to_schema(self, tool: BaseTool) -> Dict[str, Any]:
         """툴을 스키마로 변환"""
@@ -588,9 +943,19 @@ class MetaLifeAgent:
 
         self.running = True
 
+        # 큐에 들어온 태스크가 대화와 동시에 처리되도록 워커를 백그라운드로 실행
+        worker = asyncio.create_task(self.start_worker())
+        try:
+            await self._chat_loop()
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+    async def _chat_loop(self):
         while self.running:
             try:
-                user_input = input("\n💬 입력: ").strip()
+                # input()은 스레드에서 대기 (이벤트 루프 블로킹 방지)
+                user_input = (await asyncio.to_thread(input, "\n💬 입력: ")).strip()
 
                 if user_input.lower() in ["quit", "exit", "종료"]:
                     print("👋 안녕히 가세요!")
@@ -605,21 +970,47 @@ class MetaLifeAgent:
                     tools=["web_browser"],  # 기본 웹 브라우징 활성화
                 )
 
-                print("🔄 처리 중...")
-                response = await self.process_task(task)
-
-                if response.success:
-                    print(f"\n🤖 응답 ({response.execution_time:.2f}초):")
-                    print(response.content)
-
-                    if response.metadata.get("tool_results"):
+                provider = self._select_provider(task)
+                if not provider:
+                    print("\n❌ 오류: 사용 가능한 LLM 제공자가 없습니다")
+                    continue
+
+                start_time = time.perf_counter()
+                prompt = self._build_prompt(task)
+
+                # 툴 먼저 실행 - 툴 호출이 없으면 이미 생성된 응답을 그대로 출력
+                tool_schemas = self._task_tool_schemas(task)
+                if tool_schemas:
+                    print("🔄 처리 중...")
+                    content, tool_calls = await provider.generate_with_tools(
+                        prompt, tool_schemas
+                    )
+                    if not tool_calls:
+                        print(f"\n🤖 응답 ({time.perf_counter() - start_time:.2f}초):")
+                        print(content)
+                        continue
+
+                    tool_results, tool_errors = await self._execute_tool_calls(tool_calls)
+                    if tool_results:
                         print("\n🔧 툴 실행 결과:")
-                        for result in response.metadata["tool_results"]:
+                        for result in tool_results:
                             print(f"  - {result}")
-                else:
-                    print(f"\n❌ 오류: {response.error}")
-
-            except KeyboardInterrupt:
+                    for error in tool_errors:
+                        print(f"  ⚠️ 툴 실행 실패: {error}")
+
+                    # 툴 결과를 반영한 최종 응답을 스트리밍
+                    prompt = _TOOL_RESULTS_TEMPLATE.format(
+                        prompt=prompt,
+                        results="\n".join(f"- {result}" for result in tool_results),
+                    )
+
+                # 토큰이 도착하는 대로 출력 (전체 생성 완료를 기다리지 않음)
+                print("\n🤖 응답:")
+                async for text in provider.stream(prompt):
+                    print(text, end="", flush=True)
+                print(f"\n({time.perf_counter() - start_time:.2f}초)")
+
+            except (KeyboardInterrupt, EOFError):
                 print("\n👋 안녕히 가세요!")
                 break
             except Exception as e:
@@ -629,21 +1020,33 @@ class MetaLifeAgent:
         """백그라운드 워커 모드"""
         print("🔄 MetaLife OS 백그라운드 워커 시작")
         self.running = True
+        self._loop = asyncio.get_running_loop()
+
+        max_batch = self.config.get("max_batch", 8)
 
         while self.running:
             try:
-                # 큐에서 태스크 대기
+                # 큐에서 첫 태스크 대기 후 대기 중인 태스크를 최대 max_batch개까지 수거
                 task = await asyncio.wait_for(self.task_queue.get(), timeout=1.0)
+                batch = [task]
+                while len(batch) < max_batch and not self.task_queue.empty():
+                    batch.append(self.task_queue.get_nowait())
 
-                print(f"📝 태스크 처리: {task.description}")
-                response = await self.process_task(task)
+                for task in batch:
+                    print(f"📝 태스크 처리: {task.description}")
 
-                if response.success:
-                    print(f"✅ 태스크 완료: {response.execution_time:.2f}초")
-                else:
-                    print(f"❌ 태스크 실패: {response.error}")
+                # 배치 내 태스크 병렬 처리
+                responses = await asyncio.gather(
+                    *(self.process_task(task) for task in batch)
+                )
+
+                for response in responses:
+                    if response.success:
+                        print(f"✅ 태스크 완료: {response.execution_time:.2f}초")
+                    else:
+                        print(f"❌ 태스크 실패: {response.error}")
 
-                self.task_queue.task_done()
+                    self.task_queue.task_done()
 
             except asyncio.TimeoutError:
                 continue
@@ -651,20 +1054,49 @@ class MetaLifeAgent:
                 print(f"❌ 워커 오류: {e}")
 
     def add_task(self, task: AgentTask):
-        """태스크 큐에 추가"""
-        asyncio.create_task(self.task_queue.put(task))
+        """
+        태스크 큐에 추가 (동기 호출, 다른 스레드에서도 사용 가능)
+
+        워커 루프 밖의 스레드에서는 큐에 자리가 날 때까지 대기하고,
+        이벤트 루프 안에서는 즉시 추가하며 큐가 가득 차면 asyncio.QueueFull을 발생시킴.
+        루프 안에서 대기가 필요하면 put_task를 사용.
+        """
+        loop = self._loop
+        if loop is None or not loop.is_running() or self._in_loop(loop):
+            self.task_queue.put_nowait(task)
+        else:
+            asyncio.run_coroutine_threadsafe(self.task_queue.put(task), loop).result()
+
+    async def put_task(self, task: AgentTask):
+        """태스크 큐에 추가 (큐가 가득 차면 자리가 날 때까지 대기)"""
+        await self.task_queue.put(task)
+
+    @staticmethod
+    def _in_loop(loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
 
     def stop(self):
         """에이전트 중지"""
         self.running = False
 
+    async def aclose(self):
+        """에이전트 중지 및 제공자 커넥션 정리"""
+        self.stop()
+        for provider in self.providers.values():
+            await provider.aclose()
+        if self.response_cache is not None:
+            self.response_cache.close()
+
 
 # 편의 함수
 def create_agent(config_file: str = "config.json") -> MetaLifeAgent:
     """설정 파일로 에이전트 생성"""
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config_bytes = Path(config_file).read_bytes()
+        config = orjson.loads(config_bytes) if orjson else json.loads(config_bytes)
     except FileNotFoundError:
         # 기본 설정
         config = {
@@ -700,10 +1132,13 @@ async def main():
 
     agent = MetaLifeAgent(config)
 
-    if args.mode == "chat":
-        await agent.run_chat_mode()
-    else:
-        await agent.start_worker()
+    try:
+        if args.mode == "chat":
+            await agent.run_chat_mode()
+        else:
+            await agent.start_worker()
+    finally:
+        await agent.aclose()
 
 
 if __name__ == "__main__":
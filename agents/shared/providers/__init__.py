@@ -3,6 +3,7 @@ MetaLife OS - LLM Providers
 다양한 LLM 제공자를 위한 통합 인터페이스
 """
 
+from .cache import ResponseCache
 from .gemini_provider import GeminiProvider
 
-__all__ = ["GeminiProvider"]
+__all__ = ["GeminiProvider", "ResponseCache"]
@@ -0,0 +1,332 @@
+"""
+MetaLife OS - LLM 응답 캐시
+동일(정확 일치) 프롬프트 및 의미적으로 유사한 프롬프트의 응답 재사용
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    2단계 응답 캐시
+
+    1. 정확 일치: (모델, 프롬프트, 옵션)의 SHA-256 키 → 응답 (LRU, 선택적 SQLite 영속화)
+    2. 의미 일치 (선택): 문장 임베딩 코사인 유사도가 임계값 이상인 기존 프롬프트의 응답
+       - (모델, 옵션) 범위별 인덱스에서만 검색 (다른 모델/temperature의 응답 재사용 방지)
+       - LRU에서 밀려난 항목은 벡터 인덱스에서도 제거 (최대 max_entries개)
+       - wrap 경유 시 임베딩 모델 로딩/인코딩은 스레드에서 실행 (이벤트 루프 차단 없음)
+
+    SQLite 커밋은 commit_interval건마다 묶어서 수행 (close/flush 시 나머지 커밋)
+
+    사용법:
+        cache = ResponseCache(cache_dir=".cache")
+        cache.wrap(provider)  # provider.generate 호출이 캐시를 거침
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        semantic: bool = False,
+        semantic_threshold: float = 0.97,
+        cache_dir: Optional[str] = None,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        commit_interval: int = 32,
+    ):
+        self.max_entries = max_entries
+        self.semantic = semantic
+        self.semantic_threshold = semantic_threshold
+        self.embedding_model = embedding_model
+        self.commit_interval = max(1, commit_interval)
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._pending_writes = 0
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(Path(cache_dir) / "responses.sqlite3"))
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+        # 의미 캐시 (지연 초기화) - 범위별 벡터 인덱스, 벡터 ID ↔ (범위, 캐시 키)
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+        self._faiss = None
+        self._indexes: Dict[str, Any] = {}
+        self._index_keys: Dict[int, Tuple[str, str]] = {}
+        self._index_ids: Dict[str, Tuple[str, int]] = {}
+        self._next_index_id = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str, options: Dict[str, Any]) -> str:
+        """정확 일치 캐시 키 계산"""
+        hasher = hashlib.sha256()
+        hasher.update(model.encode())
+        hasher.update(prompt.encode())
+        hasher.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def make_scope(model: str, options: Dict[str, Any]) -> str:
+        """의미 캐시 검색 범위 (프롬프트를 제외한 모델/옵션 키)"""
+        return ResponseCache.make_key(model, "", options)
+
+    def get(
+        self, key: str, prompt: str, scope: str = "", embedding: Any = None
+    ) -> Optional[str]:
+        """
+        캐시 조회 (정확 일치 → 영속 저장소 → 같은 범위의 의미 일치 순)
+
+        embedding을 주지 않으면 의미 조회 시 임베딩을 동기 계산
+        (비동기 코드에서는 embed_async로 미리 계산해 전달)
+        """
+        response = self._get_exact(key)
+        if response is not None:
+            self.hits += 1
+            return response
+
+        if self.semantic and scope in self._indexes:
+            if embedding is None:
+                embedding = self._embed(prompt)
+            response = self._get_semantic(scope, embedding)
+            if response is not None:
+                self.semantic_hits += 1
+                return response
+
+        self.misses += 1
+        return None
+
+    async def embed_async(self, prompt: str) -> Any:
+        """의미 캐시용 프롬프트 임베딩 (모델 로딩/인코딩을 스레드에서 실행, 불가 시 None)"""
+        if not self.semantic:
+            return None
+        try:
+            return await asyncio.to_thread(self._embed, prompt)
+        except ImportError as e:
+            logger.warning(f"의미 캐시 비활성화: {e}")
+            self.semantic = False
+            return None
+
+    def put(
+        self,
+        key: str,
+        prompt: str,
+        response: str,
+        scope: str = "",
+        embedding: Any = None,
+    ):
+        """응답 저장 (embedding을 주지 않으면 의미 캐시 등록 시 동기 계산)"""
+        is_new = key not in self._entries
+        self._remember(key, response)
+
+        if self._db is not None:
+            # 커밋(fsync)은 이벤트 루프를 막으므로 응답마다가 아닌 묶음 단위로 수행
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (key, response),
+            )
+            self._pending_writes += 1
+            if self._pending_writes >= self.commit_interval:
+                self.flush()
+
+        if self.semantic and is_new:
+            self._add_semantic(key, prompt, scope, embedding)
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/실패 통계"""
+        return {
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
+
+    def wrap(self, provider):
+        """provider.generate/stream을 캐시 경유 버전으로 교체 (같은 요청은 같은 캐시 항목 공유)"""
+        generate = provider.generate
+        stream = provider.stream
+        model_info = provider.get_model_info()
+        model = f"{type(provider).__name__}:{model_info.get('model', '')}"
+
+        async def lookup(prompt: str, kwargs: Dict[str, Any]):
+            key = self.make_key(model, prompt, kwargs)
+            scope = self.make_scope(model, kwargs)
+
+            # 정확 일치가 없을 때만 임베딩 계산 (조회/저장에 같은 임베딩 재사용)
+            embedding = None
+            if self.semantic and not self._has_exact(key):
+                embedding = await self.embed_async(prompt)
+
+            return key, scope, embedding, self.get(key, prompt, scope, embedding)
+
+        @functools.wraps(generate)
+        async def cached_generate(prompt: str, **kwargs) -> str:
+            key, scope, embedding, cached = await lookup(prompt, kwargs)
+            if cached is not None:
+                return cached
+            response = await generate(prompt, **kwargs)
+            self.put(key, prompt, response, scope, embedding)
+            return response
+
+        @functools.wraps(stream)
+        async def cached_stream(prompt: str, **kwargs) -> AsyncIterator[str]:
+            key, scope, embedding, cached = await lookup(prompt, kwargs)
+            if cached is not None:
+                yield cached
+                return
+            # 스트림을 끝까지 받은 경우에만 저장 (중단된 부분 응답은 캐시하지 않음)
+            chunks = []
+            async for text in stream(prompt, **kwargs):
+                chunks.append(text)
+                yield text
+            self.put(key, prompt, "".join(chunks), scope, embedding)
+
+        provider.generate = cached_generate
+        # 기본 stream 구현은 (캐시 경유) generate를 호출하므로 네이티브 스트리밍만 감쌈
+        from agents.shared.core.agent import BaseProvider
+
+        if type(provider).stream is not BaseProvider.stream:
+            provider.stream = cached_stream
+        return provider
+
+    def flush(self):
+        """커밋되지 않은 응답을 영속 저장소에 커밋"""
+        if self._db is not None and self._pending_writes:
+            self._db.commit()
+            self._pending_writes = 0
+
+    def close(self):
+        """영속 저장소 연결 종료 (남은 응답 커밋 후)"""
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key: str, response: str):
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._forget_semantic(evicted)
+
+    def _has_exact(self, key: str) -> bool:
+        """정확 일치 항목 존재 여부 (LRU 순서는 갱신하지 않음)"""
+        if key in self._entries:
+            return True
+        if self._db is not None:
+            return (
+                self._db.execute(
+                    "SELECT 1 FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                is not None
+            )
+        return False
+
+    def _get_exact(self, key: str) -> Optional[str]:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._remember(key, row[0])
+                return row[0]
+
+        return None
+
+    def _init_semantic(self):
+        """임베딩 모델 초기화 (지연 로딩, 여러 스레드에서 호출되어도 1회만 로딩)"""
+        if self._encoder is not None:
+            return
+
+        with self._encoder_lock:
+            if self._encoder is not None:
+                return
+
+            try:
+                import faiss
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "의미 캐시에는 faiss-cpu, sentence-transformers 패키지가 필요합니다. "
+                    "'pip install faiss-cpu sentence-transformers' 명령으로 설치하세요."
+                )
+
+            self._faiss = faiss
+            self._encoder = SentenceTransformer(self.embedding_model)
+
+    def _embed(self, prompt: str):
+        self._init_semantic()
+        # 정규화된 임베딩의 내적 = 코사인 유사도
+        return self._encoder.encode(
+            [prompt], normalize_embeddings=True, convert_to_numpy=True
+        ).astype("float32")
+
+    def _get_semantic(self, scope: str, embedding: Any) -> Optional[str]:
+        index = self._indexes.get(scope)
+        if index is None:
+            return None
+
+        scores, ids = index.search(embedding, 1)
+        if ids[0][0] < 0 or scores[0][0] < self.semantic_threshold:
+            return None
+
+        _, key = self._index_keys[int(ids[0][0])]
+        return self._get_exact(key)
+
+    def _add_semantic(self, key: str, prompt: str, scope: str, embedding: Any):
+        if embedding is None:
+            try:
+                embedding = self._embed(prompt)
+            except ImportError as e:
+                logger.warning(f"의미 캐시 비활성화: {e}")
+                self.semantic = False
+                return
+
+        import numpy as np
+
+        index = self._indexes.get(scope)
+        if index is None:
+            # ID 매핑 인덱스 - LRU 제거 시 개별 벡터 삭제 가능
+            index = self._faiss.IndexIDMap(self._faiss.IndexFlatIP(embedding.shape[1]))
+            self._indexes[scope] = index
+
+        index_id = self._next_index_id
+        self._next_index_id += 1
+        index.add_with_ids(embedding, np.array([index_id], dtype="int64"))
+        self._index_keys[index_id] = (scope, key)
+        self._index_ids[key] = (scope, index_id)
+
+    def _forget_semantic(self, key: str):
+        """LRU에서 밀려난 키의 벡터를 의미 인덱스에서 제거 (빈 범위 인덱스는 삭제)"""
+        entry = self._index_ids.pop(key, None)
+        if entry is None:
+            return
+
+        import numpy as np
+
+        scope, index_id = entry
+        index = self._indexes[scope]
+        index.remove_ids(np.array([index_id], dtype="int64"))
+        del self._index_keys[index_id]
+        if index.ntotal == 0:
+            del self._indexes[scope]
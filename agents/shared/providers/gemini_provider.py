@@ -4,29 +4,14 @@ Google Gemini API를 사용한 LLM 제공자 구현
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 
-logger = logging.getLogger(__name__)
-
-
-class BaseProvider(ABC):
-    """LLM 제공자 기본 클래스"""
-
-    @abstractmethod
-    async def generate(self, prompt: str, **kwargs) -> str:
-        pass
+from agents.shared.core.agent import BaseProvider
 
-    @abstractmethod
-    async def generate_with_tools(
-        self, prompt: str, tools: List[Dict]
-    ) -> Tuple[str, List[Dict]]:
-        pass
-
-    @abstractmethod
-    def get_model_info(self) -> Dict[str, Any]:
-        pass
+logger = logging.getLogger(__name__)
 
 
 class GeminiProvider(BaseProvider):
@@ -44,13 +29,30 @@ class GeminiProvider(BaseProvider):
         model: str = "gemini-2.0-flash-exp",
         temperature: float = 0.7,
         max_tokens: int = 8192,
+        use_local_tokenizer: bool = False,
+        token_cache_size: int = 4096,
     ):
         self.api_key = api_key
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.use_local_tokenizer = use_local_tokenizer
+        self.token_cache_size = token_cache_size
         self._client = None
         self._initialized = False
+        self._tokenizer = None
+        self._token_counts: "OrderedDict[Tuple[bool, bytes], int]" = OrderedDict()
+
+    _genai = None  # 첫 사용 시 임포트한 google.generativeai 모듈 (클래스 공유)
+
+    @classmethod
+    def _load_genai(cls):
+        """google-generativeai 지연 임포트 (모듈 객체는 클래스에 보관)"""
+        if cls._genai is None:
+            import google.generativeai as genai
+
+            cls._genai = genai
+        return cls._genai
 
     def _init_client(self):
         """Gemini 클라이언트 초기화 (지연 로딩)"""
@@ -58,7 +60,7 @@ class GeminiProvider(BaseProvider):
             return
 
         try:
-            import google.generativeai as genai
+            genai = self._load_genai()
 
             genai.configure(api_key=self.api_key)
             self._client = genai.GenerativeModel(
@@ -104,11 +106,9 @@ class GeminiProvider(BaseProvider):
 
             logger.info(f"Gemini 생성 요청: {len(full_prompt)} 문자")
 
-            # 동기 호출을 비동기로 래핑
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, lambda: self._client.generate_content(full_prompt)
-            )
+            # 네이티브 비동기 API 사용 (스레드 풀 점유 없음, 제공자 호출 제한 적용)
+            async with self._limited():
+                response = await self._client.generate_content_async(full_prompt)
 
             result = response.text
             logger.info(f"Gemini 응답 수신: {len(result)} 문자")
@@ -118,6 +118,27 @@ class GeminiProvider(BaseProvider):
             logger.error(f"Gemini 생성 실패: {e}")
             raise
 
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Gemini API 스트리밍 생성 - 응답 조각이 도착하는 대로 반환
+
+        Args:
+            prompt: 생성할 프롬프트
+            **kwargs: 추가 옵션 (system_instruction 등)
+        """
+        self._init_client()
+
+        system_instruction = kwargs.get("system_instruction", "")
+        if system_instruction:
+            prompt = f"{system_instruction}\n\n{prompt}"
+
+        # 스트림을 모두 받을 때까지 제한 슬롯 점유
+        async with self._limited():
+            response = await self._client.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+
     async def generate_with_tools(
         self, prompt: str, tools: List[Dict]
     ) -> Tuple[str, List[Dict]]:
@@ -188,23 +209,21 @@ class GeminiProvider(BaseProvider):
         self._init_client()
 
         try:
-            # 메시지를 Gemini 채팅 형식으로 변환
-            chat = self._client.start_chat(history=[])
-            
-            # 이전 메시지 처리
-            for msg in messages[:-1]:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                if role == "user":
-                    chat.send_message(content)
-            
+            # 이전 메시지는 히스토리로 전달 (재전송 시 턴마다 API 호출 발생)
+            history = [
+                {
+                    "role": "user" if msg.get("role", "user") == "user" else "model",
+                    "parts": [msg.get("content", "")],
+                }
+                for msg in messages[:-1]
+            ]
+            chat = self._client.start_chat(history=history)
+
             # 마지막 메시지로 응답 생성
             last_message = messages[-1].get("content", "")
             
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, lambda: chat.send_message(last_message)
-            )
+            async with self._limited():
+                response = await chat.send_message_async(last_message)
 
             return response.text
 
@@ -212,20 +231,55 @@ class GeminiProvider(BaseProvider):
             logger.error(f"Gemini 채팅 생성 실패: {e}")
             raise
 
-    async def count_tokens(self, text: str) -> int:
-        """토큰 수 계산"""
-        self._init_client()
+    async def count_tokens(self, text: str, exact: bool = False) -> int:
+        """
+        토큰 수 계산 (동일 텍스트는 캐시된 결과 재사용)
 
-        try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, lambda: self._client.count_tokens(text)
-            )
-            return result.total_tokens
-        except Exception as e:
-            logger.error(f"토큰 계산 실패: {e}")
-            # 대략적인 추정 (한글 기준)
-            return len(text) // 2
+        Args:
+            text: 토큰 수를 셀 텍스트
+            exact: True면 로컬 토크나이저 대신 항상 Gemini API 사용
+
+        Returns:
+            토큰 수
+        """
+        local = self.use_local_tokenizer and not exact
+        key = (local, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        cached = self._token_counts.get(key)
+        if cached is not None:
+            self._token_counts.move_to_end(key)
+            return cached
+
+        if local:
+            # tiktoken cl100k_base 근사치 (예산 추정용, 네트워크 호출 없음)
+            count = len(self._get_tokenizer().encode(text))
+        else:
+            self._init_client()
+            try:
+                async with self._limited():
+                    result = await self._client.count_tokens_async(text)
+                count = result.total_tokens
+            except Exception as e:
+                logger.error(f"토큰 계산 실패: {e}")
+                # 대략적인 추정 (한글 기준) - 추정치는 캐시하지 않음
+                return len(text) // 2
+
+        self._token_counts[key] = count
+        if len(self._token_counts) > self.token_cache_size:
+            self._token_counts.popitem(last=False)
+        return count
+
+    def _get_tokenizer(self):
+        """로컬 토크나이저 (지연 로딩)"""
+        if self._tokenizer is None:
+            try:
+                import tiktoken
+            except ImportError:
+                raise ImportError(
+                    "로컬 토큰 계산에는 tiktoken 패키지가 필요합니다. "
+                    "'pip install tiktoken' 명령으로 설치하세요."
+                )
+            self._tokenizer = tiktoken.get_encoding("cl100k_base")
+        return self._tokenizer
 
 
 # 편의 함수
@@ -4,7 +4,7 @@ MetaLife OS - 콘텐츠 자동화 엔진 (Blog_automation_OS 개념 적용)
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 from enum import Enum
 import asyncio
 import json
@@ -13,14 +13,250 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import hashlib
 import os
+import random
+import re
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:  # aiolimiter 미설치 시 속도 제한 없이 동작
+    AsyncLimiter = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치 시 키워드별 부분 문자열 검사
+    ahocorasick = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 하이라이트 점수/정렬을 순수 Python으로 처리
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba 미설치 시 하이라이트 점수를 NumPy 연산으로 계산
+    njit = None
+
+try:
+    from blake3 import blake3
+except ImportError:  # blake3 미설치 시 SHA-256으로 중복 검사 해시 계산
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import textstat
+except ImportError:  # textstat 미설치 시 자체 휴리스틱으로 가독성 평가
+    textstat = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+# 인제스트 파일 중복 검사 해시 알고리즘 (암호학적 요구 없음 - 빠른 blake3 우선)
+_CONTENT_HASH_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
+# 품질 항목별 가중치 (전체 점수 = 가중평균)와 재생성 기준 점수
+_SCORE_WEIGHTS = {
+    "hook": 0.30,
+    "relevance": 0.25,
+    "readability": 0.20,
+    "seo": 0.10,
+    "originality": 0.15,
+}
+_QUALITY_THRESHOLD = 70
+
+def _build_automaton(keywords: Dict[str, Any]):
+    """
+    키워드 → 값 Aho-Corasick 오토마톤 생성 (pyahocorasick 없으면 None)
+
+    텍스트 한 번 순회로 모든 키워드 등장 위치를 찾으므로
+    키워드마다 텍스트를 다시 훑는 부분 문자열 검사를 대체
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword, value in keywords.items():
+        automaton.add_word(keyword, value)
+    automaton.make_automaton()
+    return automaton
+
+
+def _trie_pattern(words: Tuple[str, ...]) -> str:
+    """
+    단어 목록을 트라이 형태의 정규식으로 변환
+
+    공통 접두사를 한 번만 비교하므로 단순 "a|b|c" 합집합보다 백트래킹이 적고,
+    findall 한 번으로 모든 단어의 등장 횟수를 셀 수 있음
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # 단어 끝 표시
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+
+    return build(trie)
+
+
+# 세그먼트 수가 이 이상일 때만 배열 연산/JIT 커널 사용 (적은 세그먼트는 순수 Python이 더 빠름)
+_VECTORIZE_MIN_SEGMENTS = 512
+
+if njit is not None:
+
+    @njit(parallel=True)
+    def _score_segments_numba(keyword_counts, emotion_counts):
+        """세그먼트별 하이라이트 점수 계산 및 최소 점수(10) 필터 (병렬 JIT 커널)"""
+        n = keyword_counts.shape[0]
+        scores = np.empty(n, np.int32)
+        mask = np.empty(n, np.bool_)
+        for i in prange(n):
+            scores[i] = keyword_counts[i] * 10 + emotion_counts[i] * 5
+            mask[i] = scores[i] >= 10
+        return mask, scores
+
+else:
+    _score_segments_numba = None
+
+
+def _warm_up_kernels():
+    """JIT 커널 사전 컴파일 (첫 요청에서 컴파일 지연이 발생하지 않도록)"""
+    if _score_segments_numba is not None:
+        _score_segments_numba(np.zeros(1, np.int32), np.zeros(1, np.int32))
+
+
+# 플랫폼별 콘텐츠 작성 지침
+_PLATFORM_INSTRUCTIONS = {
+    "wordpress": "블로그 포스팅 형식으로 작성해주세요. 제목, 본문, 태그, 카테고리를 포함해주세요.",
+    "youtube": "유튜브 영상 설명으로 작성해주세요. 타임스탬프, 관련 링크, 해시태그를 포함해주세요.",
+    "naver_blog": "네이버 블로그 포스팅으로 작성해주세요. 한국어 자연스러운 표현을 사용해주세요.",
+    "instagram": "인스타그램 캡션으로 작성해주세요. 해시태그, 짧은 문장, 이모지를 포함해주세요.",
+    "facebook": "페이스북 포스팅으로 작성해주세요. 참여를 유도하는 질문을 포함해주세요.",
+    "tiktok": "틱톡 콘텐츠로 작성해주세요. 짧고 흥미로운 문장과 해시태그를 포함해주세요.",
+}
+
+
+@lru_cache(maxsize=256)
+def _content_prompt(
+    platform: str, filename: str, excerpt: str, word_count: int, chapter_count: int
+) -> str:
+    """플랫폼별 콘텐츠 생성 프롬프트 (재생성 시 동일 입력 반복 → 캐시)"""
+    instruction = _PLATFORM_INSTRUCTIONS.get(platform, "콘텐츠를 작성해주세요.")
+
+    prompt = f"""
+        다음 비디오 전사 내용을 바탕으로 {platform}용 콘텐츠를 생성해주세요.
+        
+        비디오 정보:
+        - 제목: {filename}
+        - 전사 내용: {excerpt}...
+        - 단어 수: {word_count}
+        - 챕터: {chapter_count}
+        
+        요구사항:
+        {instruction}
+        
+        SEO 최적화를 위해 관련 키워드를 자연스럽게 포함해주세요.
+        
+        JSON 형식으로 반환해주세요:
+        {{
+            "title": "제목",
+            "body": "본문 내용",
+            "tags": ["태그1", "태그2", "태그3"],
+            "categories": ["카테고리1"],
+            "summary": "요약",
+            "call_to_action": "행동 유도 문구"
+        }}
+        """
+
+    return prompt
+
+
+def _json_bytes(data: Any) -> bytes:
+    """JSON 직렬화 결과를 bytes로 반환 (orjson 우선)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:  # orjson 미지원 타입은 표준 json으로 처리
+            pass
+    return json.dumps(data).encode()
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """JSON 역직렬화 (orjson 우선, 실패 시 json.JSONDecodeError와 같은 ValueError 계열)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 문장 끝: 공백/본문 끝이 뒤따르는 마침표/느낌표/물음표 연속 ("3.14" 같은 소수점은 제외)
+_SENTENCE_END_RE = re.compile(r"[.!?]+(?=\s|$)")
+
+
+@lru_cache(maxsize=1024)
+def _readability_features(body: str) -> Tuple[float, int]:
+    """
+    본문 가독성 특징 추출 (평균 문장 길이(단어), 문단 수)
+
+    재생성/재검증 시 동일 본문이 반복되므로 본문 단위로 캐시 (엔진 재시작 시 초기화)
+    """
+    # 빈 조각(후행 마침표 뒤, 연속 공백)은 문장으로 세지 않음
+    sentence_count = 0
+    word_count = 0
+    for sentence in _SENTENCE_END_RE.split(body):
+        words = len(sentence.split())
+        if words:
+            sentence_count += 1
+            word_count += words
+    avg_sentence_length = word_count / sentence_count if sentence_count else 0.0
+    # 문단 수 = 조각 수 - 빈 조각 - 공백뿐인 조각 (조각별 strip 복사/제너레이터 순회 없이)
+    paragraphs = body.split("\n\n")
+    paragraph_count = len(paragraphs) - paragraphs.count("") - sum(map(str.isspace, paragraphs))
+    return avg_sentence_length, paragraph_count
+
+
+@lru_cache(maxsize=1024)
+def _textstat_readability(body: str) -> Optional[float]:
+    """
+    영어 본문 가독성 점수 (textstat 기반, 0-100)
+
+    textstat 공식은 영어 기준이므로 한글 비중이 높거나 textstat이 없으면 None
+    """
+    if textstat is None:
+        return None
+
+    letters = sum(1 for c in body if c.isalpha())
+    hangul = sum(1 for c in body if "가" <= c <= "힣")
+    if not letters or hangul / letters > 0.1:
+        return None
+
+    flesch = textstat.flesch_reading_ease(body)
+    fog = textstat.gunning_fog(body)
+    return max(0.0, min(flesch * 0.5 + (20 - fog) * 5, 100.0))
+
+
 class AssetType(Enum):
     """에셋 유형"""
 
@@ -54,7 +290,7 @@ class JobStage(Enum):
     PUBLISH = "publish"
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """미디어 에셋 정보"""
 
@@ -62,15 +298,16 @@ class Asset:
     asset_type: AssetType
     filename: str
     filepath: str
-    sha256_hash: str
+    content_hash: str  # 중복 검사용 내용 해시 (알고리즘은 hash_algorithm)
     file_size: int
     mime_type: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     parent_asset_id: Optional[str] = None
+    hash_algorithm: str = "sha256"
     created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """자동화 작업"""
 
@@ -88,7 +325,7 @@ class Job:
     completed_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Generation:
     """AI 생성 결과"""
 
@@ -99,10 +336,12 @@ class Generation:
     content: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     score: float = 0.0
+    valid: bool = True  # 모델 응답에서 JSON 추출 성공 여부
+    parsed: Optional[Dict[str, Any]] = field(default=None, repr=False)  # content 파싱 결과
     created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityReport:
     """품질 검증 보고서"""
 
@@ -120,9 +359,253 @@ class QualityReport:
     created_at: datetime = field(default_factory=datetime.now)
 
 
+@dataclass(slots=True)
+class ContentView:
+    """품질 평가용 콘텐츠 필드 (키 누락/None/빈 값을 빈 값으로 통일, 길이는 한 번만 계산)"""
+
+    title: str
+    body: str
+    summary: str
+    tags: Sequence[str]
+    categories: Sequence[str]
+    title_length: int
+    body_length: int
+
+    @classmethod
+    def build(cls, content_data: Dict[str, Any]) -> "ContentView":
+        """콘텐츠 dict에서 평가용 뷰 생성"""
+        get = content_data.get
+        title, body = get("title") or "", get("body") or ""
+        return cls(
+            title=title,
+            body=body,
+            summary=get("summary") or "",
+            tags=get("tags") or (),
+            categories=get("categories") or (),
+            title_length=len(title),
+            body_length=len(body),
+        )
+
+
+# 영속 저장소 스키마 (content_hash UNIQUE - NULL은 중복 허용이므로 해시 미계산 에셋도 저장 가능)
+_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id TEXT PRIMARY KEY,
+    content_hash TEXT UNIQUE,
+    hash_algorithm TEXT NOT NULL,
+    asset_type TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    filepath TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    mime_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    parent_asset_id TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    asset_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    status TEXT NOT NULL,
+    data BLOB NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_asset_id ON jobs (asset_id);
+CREATE TABLE IF NOT EXISTS generations (
+    id TEXT PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    content TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    score REAL NOT NULL,
+    valid INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS generations_job_id ON generations (job_id);
+"""
+
+_ASSET_COLUMNS = (
+    "id, content_hash, hash_algorithm, asset_type, filename, filepath, "
+    "file_size, mime_type, metadata, parent_asset_id, created_at"
+)
+
+
+class EngineStore:
+    """
+    엔진 레지스트리 영속 저장소 (SQLite, WAL 모드)
+
+    에셋/작업/생성 결과를 메모리 대신 인덱스된 테이블에 보관하고,
+    중복 에셋 판정은 content_hash UNIQUE 제약을 이용해 INSERT 한 번으로 처리
+    """
+
+    def __init__(self, db_path: str):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_STORE_SCHEMA)
+        self._db.commit()
+
+    def add_asset(self, asset: Asset) -> Asset:
+        """에셋 저장 (동일 해시 에셋이 이미 있으면 저장하지 않고 기존 에셋 반환)"""
+        row = self._db.execute(
+            f"INSERT INTO assets ({_ASSET_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (content_hash) DO NOTHING RETURNING id",
+            (
+                asset.id,
+                asset.content_hash or None,
+                asset.hash_algorithm,
+                asset.asset_type.value,
+                asset.filename,
+                asset.filepath,
+                asset.file_size,
+                asset.mime_type,
+                _json_bytes(asset.metadata),
+                asset.parent_asset_id,
+                asset.created_at.isoformat(),
+            ),
+        ).fetchone()
+        self._db.commit()
+
+        if row is None:
+            return self.get_asset_by_hash(asset.content_hash)
+        return asset
+
+    def get_asset(self, asset_id: str) -> Optional[Asset]:
+        """ID로 에셋 조회"""
+        row = self._db.execute(
+            f"SELECT {_ASSET_COLUMNS} FROM assets WHERE id = ?", (asset_id,)
+        ).fetchone()
+        return self._asset_from_row(row) if row else None
+
+    def get_asset_by_hash(self, content_hash: str) -> Optional[Asset]:
+        """내용 해시로 에셋 조회"""
+        row = self._db.execute(
+            f"SELECT {_ASSET_COLUMNS} FROM assets WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        return self._asset_from_row(row) if row else None
+
+    def save_job(self, job: Job):
+        """작업 저장 (상태 변경 시마다 호출 - 기존 행 갱신)"""
+        data = {
+            "parameters": job.parameters,
+            "result": job.result,
+            "error": job.error,
+            "retry_count": job.retry_count,
+            "max_retries": job.max_retries,
+            "progress": job.progress,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        }
+        self._db.execute(
+            "INSERT INTO jobs (id, asset_id, stage, status, data, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET status = excluded.status, data = excluded.data",
+            (
+                job.id,
+                job.asset_id,
+                job.stage.value,
+                job.status.value,
+                _json_bytes(data),
+                job.created_at.isoformat(),
+            ),
+        )
+        self._db.commit()
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """ID로 작업 조회"""
+        row = self._db.execute(
+            "SELECT id, asset_id, stage, status, data, created_at FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        data = _json_loads(row[4])
+        completed_at = data.pop("completed_at")
+        return Job(
+            id=row[0],
+            asset_id=row[1],
+            stage=JobStage(row[2]),
+            status=JobStatus(row[3]),
+            created_at=datetime.fromisoformat(row[5]),
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            **data,
+        )
+
+    def save_generation(self, generation: Generation):
+        """생성 결과 저장"""
+        self._db.execute(
+            "INSERT OR REPLACE INTO generations "
+            "(id, job_id, platform, content_type, content, metadata, score, valid, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                generation.id,
+                generation.job_id,
+                generation.platform,
+                generation.content_type,
+                generation.content,
+                _json_bytes(generation.metadata),
+                generation.score,
+                generation.valid,
+                generation.created_at.isoformat(),
+            ),
+        )
+        self._db.commit()
+
+    def get_generation(self, generation_id: str) -> Optional[Generation]:
+        """ID로 생성 결과 조회"""
+        row = self._db.execute(
+            "SELECT id, job_id, platform, content_type, content, metadata, score, valid, created_at "
+            "FROM generations WHERE id = ?",
+            (generation_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        return Generation(
+            id=row[0],
+            job_id=row[1],
+            platform=row[2],
+            content_type=row[3],
+            content=row[4],
+            metadata=_json_loads(row[5]),
+            score=row[6],
+            valid=bool(row[7]),
+            created_at=datetime.fromisoformat(row[8]),
+        )
+
+    def close(self):
+        """저장소 연결 종료"""
+        self._db.close()
+
+    @staticmethod
+    def _asset_from_row(row: Tuple) -> Asset:
+        return Asset(
+            id=row[0],
+            content_hash=row[1] or "",
+            hash_algorithm=row[2],
+            asset_type=AssetType(row[3]),
+            filename=row[4],
+            filepath=row[5],
+            file_size=row[6],
+            mime_type=row[7],
+            metadata=_json_loads(row[8]),
+            parent_asset_id=row[9],
+            created_at=datetime.fromisoformat(row[10]),
+        )
+
+
 class BasePublisher(ABC):
     """퍼블리셔 기본 클래스"""
 
+    # 모든 퍼블리셔가 공유하는 HTTP 세션 (커넥션 풀/TLS 세션 재사용)
+    _aiohttp = None
+    _session = None
+
+    # 재시도 대상 HTTP 상태 코드 (속도 제한, 일시적 서버 오류)
+    retry_status_codes = {429, 500, 502, 503, 504}
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -134,6 +617,77 @@ class BasePublisher(ABC):
     ) -> Dict[str, Any]:
         pass
 
+    @classmethod
+    async def get_session(cls):
+        """공유 aiohttp.ClientSession 획득 (지연 생성)"""
+        if BasePublisher._session is None or BasePublisher._session.closed:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError("aiohttp 패키지가 필요합니다")
+
+            BasePublisher._aiohttp = aiohttp
+            BasePublisher._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=300),
+            )
+        return BasePublisher._session
+
+    @classmethod
+    async def close_session(cls):
+        """공유 세션 종료"""
+        if BasePublisher._session is not None:
+            await BasePublisher._session.close()
+            BasePublisher._session = None
+
+    async def _upload_file(
+        self,
+        url: str,
+        filepath: str,
+        field: str = "file",
+        content_type: str = "application/octet-stream",
+        fields: Optional[Dict[str, str]] = None,
+        **request_kwargs,
+    ) -> Dict[str, Any]:
+        """
+        멀티파트 파일 업로드 (공유 세션 사용)
+
+        파일 객체를 그대로 넘기면 aiohttp가 청크 단위로 읽어 전송하므로
+        (읽기는 executor에서 수행) 대용량 영상도 메모리에 전부 올리지 않음
+        """
+        session = await self.get_session()
+        path = Path(filepath)
+
+        with path.open("rb") as file:
+            form = self._aiohttp.FormData()
+            for name, value in (fields or {}).items():
+                form.add_field(name, value)
+            form.add_field(field, file, filename=path.name, content_type=content_type)
+
+            async with session.post(url, data=form, **request_kwargs) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    @classmethod
+    def _error_result(cls, error: Exception) -> Dict[str, Any]:
+        """발행 실패 결과 (일시적 오류면 retryable로 표시)"""
+        return {
+            "success": False,
+            "error": str(error),
+            "retryable": cls._is_retryable(error),
+        }
+
+    @classmethod
+    def _is_retryable(cls, error: Exception) -> bool:
+        """재시도로 해결될 수 있는 오류인지 판단 (타임아웃, 연결 오류, 429/5xx)"""
+        if isinstance(error, asyncio.TimeoutError):
+            return True
+        status = getattr(error, "status", None)  # aiohttp.ClientResponseError
+        if status is not None:
+            return status in cls.retry_status_codes
+        aiohttp = BasePublisher._aiohttp
+        return aiohttp is not None and isinstance(error, aiohttp.ClientConnectionError)
+
 
 class WordPressPublisher(BasePublisher):
     """WordPress 퍼블리셔"""
@@ -147,6 +701,32 @@ class WordPressPublisher(BasePublisher):
     def name(self) -> str:
         return "WordPress"
 
+    async def _wp_request(
+        self, method: str, path: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """WordPress REST API 요청 (공유 세션 사용)"""
+        session = await self.get_session()
+        async with session.request(
+            method,
+            f"{self.api_url}{path}",
+            json=data,
+            auth=self._aiohttp.BasicAuth(self.username, self.password),
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def upload_media(
+        self, filepath: str, content_type: str = "application/octet-stream"
+    ) -> Dict[str, Any]:
+        """미디어 라이브러리 업로드 (응답의 id를 featured_media로 사용)"""
+        await self.get_session()
+        return await self._upload_file(
+            f"{self.api_url}/wp/v2/media",
+            filepath,
+            content_type=content_type,
+            auth=self._aiohttp.BasicAuth(self.username, self.password),
+        )
+
     async def publish(
         self, content: Dict[str, Any], options: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -161,7 +741,7 @@ class WordPressPublisher(BasePublisher):
                 "featured_media": content.get("featured_media_id"),
             }
 
-            # 실제 구현에서는 requests 또는 aiohttp 사용
+            # 실제 구현에서는 공유 세션 기반 _wp_request 사용
             # response = await self._wp_request("POST", "/wp/v2/posts", post_data)
 
             logger.info(f"WordPress 발행: {content['title']}")
@@ -173,7 +753,7 @@ class WordPressPublisher(BasePublisher):
             }
         except Exception as e:
             logger.error(f"WordPress 발행 실패: {e}")
-            return {"success": False, "error": str(e)}
+            return self._error_result(e)
 
 
 class YouTubePublisher(BasePublisher):
@@ -212,7 +792,7 @@ class YouTubePublisher(BasePublisher):
             }
         except Exception as e:
             logger.error(f"YouTube 업로드 실패: {e}")
-            return {"success": False, "error": str(e)}
+            return self._error_result(e)
 
 
 class NaverBlogPublisher(BasePublisher):
@@ -248,23 +828,135 @@ class NaverBlogPublisher(BasePublisher):
             }
         except Exception as e:
             logger.error(f"네이버 블로그 발행 실패: {e}")
-            return {"success": False, "error": str(e)}
+            return self._error_result(e)
 
 
 class ContentAutomationEngine:
     """콘텐츠 자동화 엔진"""
 
+    # 평가 키워드 상수 (부분 문자열 검사이므로 frozenset이 아닌 순서 있는 tuple)
+    # Hook 단어 (제목+요약에 포함된 단어 종류 수로 평가)
+    HOOK_WORDS = (
+        "핵심",
+        "비밀",
+        "충격",
+        "놀라운",
+        "반드시",
+        "꼭",
+        "신기",
+        "특별",
+        "혁신적",
+        "첫",
+        "마지막",
+        "최고",
+        "최악",
+        "결과",
+        "방법",
+    )
+
+    # 일반적 표현 (독창성 감점 요소, 등장 횟수당 5점)
+    COMMON_PHRASES = (
+        "오늘은",
+        "안녕하세요",
+        "많은 분들이",
+        "궁금해하시는",
+        "여러분",
+        "정말로",
+        "매우",
+        "아주",
+    )
+
+    # 하이라이트 키워드 / 감정 강도 키워드 (세그먼트에 포함된 종류 수로 평가)
+    HIGHLIGHT_KEYWORDS = (
+        "핵심",
+        "중요",
+        "결론",
+        "결과",
+        "성공",
+        "실패",
+        "문제",
+        "해결",
+        "방법",
+        "팁",
+        "꿀팁",
+        "충격",
+        "놀라",
+        "신기",
+        "특별",
+        "첫",
+        "마지막",
+    )
+    EMOTION_KEYWORDS = ("!", "?", "정말", "매우", "아주")
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.publishers: Dict[str, BasePublisher] = {}
         self.jobs: List[Job] = []
         self.assets: Dict[str, Asset] = {}
+        self._hash_index: Dict[str, Asset] = {}  # 내용 해시 -> 에셋 (중복 검사용)
         self.generations: Dict[str, Generation] = {}
         self.quality_reports: Dict[str, QualityReport] = {}
 
+        # db_path 설정 시 에셋/작업/생성 결과는 메모리 대신 SQLite에 저장
+        db_path = self.config.get("db_path")
+        self._store: Optional[EngineStore] = EngineStore(db_path) if db_path else None
+
+        # 외부 API 속도 제한 (토큰 버킷 - 동시성은 유지하면서 호출률만 제한)
+        self._openai_limiter = self._make_limiter(
+            self.config.get("openai_rpm", 60), 60
+        )
+        self._publisher_limiters = {
+            "wordpress": self._make_limiter(self.config.get("wordpress_rps", 5), 1),
+            "youtube": self._make_limiter(self.config.get("youtube_rps", 1), 1),
+            "naver_blog": self._make_limiter(self.config.get("naver_blog_rps", 5), 1),
+        }
+
+        # 동시 실행 ffprobe 프로세스 수 제한
+        self._ffprobe_semaphore = asyncio.Semaphore(self.config.get("ffprobe_concurrency", 4))
+
+        # CPU 바운드 품질 평가용 프로세스 풀 (첫 사용 시 생성)
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+
         # 퍼블리셔 초기화
         self._initialize_publishers()
 
+        # 플랫폼별 동시 발행 수 제한
+        self._publish_semaphores = {
+            platform: asyncio.Semaphore(self.config.get("publish_concurrency", 3))
+            for platform in self.publishers
+        }
+
+    @staticmethod
+    def _make_limiter(max_rate: float, time_period: float):
+        """time_period초당 max_rate회로 제한하는 리미터 (aiolimiter 없으면 제한 없음)"""
+        if AsyncLimiter is None:
+            return nullcontext()
+        return AsyncLimiter(max_rate, time_period)
+
+    def _get_cpu_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        품질 평가용 공유 프로세스 풀 (cpu_workers가 0(기본)이면 None - 인라인 실행)
+
+        콘텐츠당 평가는 수십 마이크로초라 프로세스 시작/pickle 비용이 더 크므로
+        대량 배치 검증처럼 이득이 확인된 경우에만 cpu_workers를 지정
+        """
+        workers = self.config.get("cpu_workers", 0)
+        if not workers:
+            return None
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=workers)
+        return self._cpu_pool
+
+    async def aclose(self):
+        """엔진 리소스 정리 (퍼블리셔 공유 HTTP 세션, 영속 저장소, 프로세스 풀 종료)"""
+        await BasePublisher.close_session()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+
     def _initialize_publishers(self):
         """퍼블리셔 초기화"""
 
@@ -315,18 +1007,11 @@ class ContentAutomationEngine:
             if not file_path.exists():
                 raise FileNotFoundError(f"파일이 존재하지 않음: {filepath}")
 
-            # SHA256 해시 계산
-            sha256_hash = self._calculate_sha256(file_path)
+            # 내용 해시 계산 (대용량 파일도 이벤트 루프를 막지 않도록 스레드에서 수행)
+            content_hash = await asyncio.to_thread(self._calculate_content_hash, file_path)
 
             # 중복 검사
-            existing_asset = next(
-                (
-                    asset
-                    for asset in self.assets.values()
-                    if asset.sha256_hash == sha256_hash
-                ),
-                None,
-            )
+            existing_asset = self._find_asset_by_hash(content_hash)
 
             if existing_asset:
                 logger.info(
@@ -343,13 +1028,21 @@ class ContentAutomationEngine:
                 asset_type=self._detect_asset_type(file_path),
                 filename=file_path.name,
                 filepath=str(file_path.absolute()),
-                sha256_hash=sha256_hash,
+                content_hash=content_hash,
+                hash_algorithm=_CONTENT_HASH_ALGORITHM,
                 file_size=file_path.stat().st_size,
                 mime_type=self._detect_mime_type(file_path),
                 metadata=metadata,
             )
 
-            self.assets[asset.id] = asset
+            registered = self._register_asset(asset)
+            if registered is not asset:
+                # 해시 계산 이후 동일 파일이 먼저 등록된 경우
+                logger.info(
+                    f"중복 파일 감지: {registered.filename} (Asset #{registered.id})"
+                )
+                return registered, True
+
             logger.info(f"파일 인제스트 완료: {asset.filename} (Asset #{asset.id})")
 
             return asset, False
@@ -389,51 +1082,70 @@ class ContentAutomationEngine:
                 )
                 return results
 
-            # 3. GENERATE 단계
-            try:
-                generation_results = await self._generate_content(
-                    asset, transcript_result
-                )
-                results["stages_completed"].append("GENERATE")
-                results["generations"] = generation_results
-            except Exception as e:
-                logger.error(f"GENERATE 실패: {e}")
-                results["stages_failed"].append({"stage": "GENERATE", "error": str(e)})
-                return results
-
-            # 4. VALIDATE 단계
-            try:
-                validation_results = await self._validate_content(generation_results)
-                results["stages_completed"].append("VALIDATE")
-                results["quality_reports"] = validation_results
-            except Exception as e:
-                logger.error(f"VALIDATE 실패: {e}")
-                results["stages_failed"].append({"stage": "VALIDATE", "error": str(e)})
-                return results
+            # RENDER는 전사 결과에만 의존하므로 GENERATE/VALIDATE와 동시에 진행
+            render_task = asyncio.create_task(
+                self._render_shorts(asset, transcript_result)
+            )
 
-            # 5. RENDER 단계 (Shorts 생성)
             try:
-                render_results = await self._render_shorts(asset, transcript_result)
-                results["stages_completed"].append("RENDER")
-                results["shorts"] = render_results
-            except Exception as e:
-                logger.error(f"RENDER 실패: {e}")
-                results["stages_failed"].append({"stage": "RENDER", "error": str(e)})
-                return results
+                # 3. GENERATE 단계
+                try:
+                    generation_results = await self._generate_content(
+                        asset, transcript_result
+                    )
+                    results["stages_completed"].append("GENERATE")
+                    results["generations"] = generation_results
+                except Exception as e:
+                    logger.error(f"GENERATE 실패: {e}")
+                    results["stages_failed"].append(
+                        {"stage": "GENERATE", "error": str(e)}
+                    )
+                    return results
 
-            # 6. PUBLISH 단계
-            if auto_process:
+                # 4. VALIDATE 단계
                 try:
-                    publish_results = await self._publish_content(
-                        generation_results, validation_results
+                    validation_results = await self._validate_content(
+                        generation_results
                     )
-                    results["stages_completed"].append("PUBLISH")
-                    results["publish_results"] = publish_results
+                    results["stages_completed"].append("VALIDATE")
+                    results["quality_reports"] = list(validation_results.values())
+                except Exception as e:
+                    logger.error(f"VALIDATE 실패: {e}")
+                    results["stages_failed"].append(
+                        {"stage": "VALIDATE", "error": str(e)}
+                    )
+                    return results
+
+                # 5. RENDER 단계 (Shorts 생성) - 백그라운드 렌더링 결과 대기
+                try:
+                    render_results = await render_task
+                    results["stages_completed"].append("RENDER")
+                    results["shorts"] = render_results
                 except Exception as e:
-                    logger.error(f"PUBLISH 실패: {e}")
+                    logger.error(f"RENDER 실패: {e}")
                     results["stages_failed"].append(
-                        {"stage": "PUBLISH", "error": str(e)}
+                        {"stage": "RENDER", "error": str(e)}
                     )
+                    return results
+
+                # 6. PUBLISH 단계
+                if auto_process:
+                    try:
+                        publish_results = await self._publish_content(
+                            generation_results, validation_results
+                        )
+                        results["stages_completed"].append("PUBLISH")
+                        results["publish_results"] = publish_results
+                    except Exception as e:
+                        logger.error(f"PUBLISH 실패: {e}")
+                        results["stages_failed"].append(
+                            {"stage": "PUBLISH", "error": str(e)}
+                        )
+            finally:
+                # 앞 단계 실패로 조기 반환 시 렌더링 작업 정리
+                if not render_task.done():
+                    render_task.cancel()
+                    await asyncio.gather(render_task, return_exceptions=True)
 
             results["status"] = "completed"
             logger.info(f"비디오 처리 완료: {asset.filename}")
@@ -457,25 +1169,30 @@ class ContentAutomationEngine:
                 "output_formats": ["text", "srt", "vtt", "json"],
             },
         )
-        self.jobs.append(job)
+        if self._store is not None:
+            self._store.save_job(job)
+        else:
+            self.jobs.append(job)
         return job
 
     async def _process_transcribe_job(self, job: Job) -> Dict[str, Any]:
         """전사 작업 처리"""
         job.status = JobStatus.RUNNING
-        asset = self.assets[job.asset_id]
+        self._persist_job(job)
+        asset = self._get_asset(job.asset_id)
 
         try:
             # Whisper API 호출 (OpenAI)
             import openai
 
             with open(asset.filepath, "rb") as audio_file:
-                transcript = await openai.Audio.atranscribe(
-                    model=job.parameters["model"],
-                    file=audio_file,
-                    language=job.parameters["language"],
-                    response_format="verbose_json",
-                )
+                async with self._openai_limiter:
+                    transcript = await openai.Audio.atranscribe(
+                        model=job.parameters["model"],
+                        file=audio_file,
+                        language=job.parameters["language"],
+                        response_format="verbose_json",
+                    )
 
             # 결과 처리
             result = {
@@ -490,23 +1207,26 @@ class ContentAutomationEngine:
                 "vtt_content": self._generate_vtt(transcript),
             }
 
-            # 전사 에셋 저장
+            # 전사 에셋 저장 (직렬화 1회 - 해시와 크기 계산에 재사용)
+            payload = _json_bytes(result)
             transcript_asset = Asset(
                 id=str(uuid.uuid4()),
                 asset_type=AssetType.TRANSCRIPT,
                 filename=f"{asset.filename}_transcript.json",
                 filepath=f"{asset.filepath}_transcript.json",
-                sha256_hash=hashlib.sha256(json.dumps(result).encode()).hexdigest(),
-                file_size=len(json.dumps(result).encode()),
+                # 외부 시스템과 비교 가능하도록 전사 결과는 SHA-256 유지
+                content_hash=hashlib.sha256(payload).hexdigest(),
+                file_size=len(payload),
                 mime_type="application/json",
                 metadata=result,
                 parent_asset_id=asset.id,
             )
-            self.assets[transcript_asset.id] = transcript_asset
+            self._register_asset(transcript_asset)
 
             job.status = JobStatus.COMPLETED
             job.result = result
             job.completed_at = datetime.now()
+            self._persist_job(job)
 
             logger.info(f"전사 완료: {asset.filename} ({result['word_count']} words)")
             return result
@@ -514,6 +1234,7 @@ class ContentAutomationEngine:
         except Exception as e:
             job.status = JobStatus.FAILED
             job.error = str(e)
+            self._persist_job(job)
             raise
 
     async def _generate_content(
@@ -531,109 +1252,225 @@ class ContentAutomationEngine:
         ]
 
         # OpenAI GPT-4를 통한 콘텐츠 생성
-        import openai
+        import openai  # 미설치 시 GENERATE 단계 실패로 처리
 
-        for platform in platforms:
+        # 1차: 전 플랫폼을 단일 요청으로 생성 (공통 컨텍스트를 한 번만 전송)
+        batched: Dict[str, Generation] = {}
+        if self.config.get("batch_generation", True):
             try:
-                prompt = self._build_content_prompt(platform, asset, transcript_result)
-
-                response = await openai.ChatCompletion.acreate(
-                    model="gpt-4",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": f"당신은 {platform} 플랫폼 전문 콘텐츠 크리에이터입니다.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.7,
-                    max_tokens=2000,
-                )
+                batched = await self._gen_batch(platforms, asset, transcript_result)
+            except Exception as e:
+                logger.error(f"일괄 콘텐츠 생성 실패, 플랫폼별 생성으로 전환: {e}")
+
+        # 2차: 일괄 결과에 없는 플랫폼만 개별 요청을 동시에 실행
+        remaining = [platform for platform in platforms if platform not in batched]
+        results = await asyncio.gather(
+            *(
+                self._gen_one(platform, asset, transcript_result)
+                for platform in remaining
+            ),
+            return_exceptions=True,
+        )
+        batched.update(zip(remaining, results))
 
-                content = response.choices[0].message.content
+        for platform in platforms:
+            result = batched[platform]
+            if isinstance(result, Exception):
+                logger.error(f"{platform} 콘텐츠 생성 실패: {result}")
+                continue
 
-                # 생성 결과 파싱
-                parsed_content = self._parse_generated_content(content, platform)
+            generations.append(result)
+            if self._store is not None:
+                self._store.save_generation(result)
+            else:
+                self.generations[result.id] = result
+            logger.info(f"콘텐츠 생성 완료: {platform}")
 
-                generation = Generation(
-                    id=str(uuid.uuid4()),
-                    job_id=str(uuid.uuid4()),
-                    platform=platform,
-                    content_type="blog_post"
-                    if platform in ["wordpress", "naver_blog"]
-                    else "social_post",
-                    content=json.dumps(parsed_content, ensure_ascii=False),
-                    metadata={
-                        "prompt": prompt,
-                        "model": "gpt-4",
-                        "token_usage": response.usage.total_tokens
-                        if hasattr(response, "usage")
-                        else 0,
+        return generations
+
+    async def _gen_batch(
+        self, platforms: List[str], asset: Asset, transcript_result: Dict[str, Any]
+    ) -> Dict[str, Generation]:
+        """전 플랫폼 콘텐츠 일괄 생성 (JSON 객체로 반환된 플랫폼만 결과에 포함)"""
+        import openai
+
+        prompt = self._build_batch_prompt(platforms, asset, transcript_result)
+
+        async with self._openai_limiter:
+            response = await openai.ChatCompletion.acreate(
+                model="gpt-4",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "당신은 여러 플랫폼에 능숙한 전문 콘텐츠 크리에이터입니다.",
                     },
-                )
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.7,
+                max_tokens=self.config.get("batch_max_tokens", 6000),
+            )
 
-                generations.append(generation)
-                self.generations[generation.id] = generation
+        parsed, _ = self._parse_generated_content(
+            response.choices[0].message.content, "batch"
+        )
+        contents = {
+            platform: parsed[platform]
+            for platform in platforms
+            if isinstance(parsed.get(platform), dict)
+        }
 
-                logger.info(f"콘텐츠 생성 완료: {platform}")
+        # 토큰 사용량은 플랫폼 수로 균등 배분
+        total_tokens = response.usage.total_tokens if hasattr(response, "usage") else 0
+        token_share = total_tokens / len(contents) if contents else 0
 
-            except Exception as e:
-                logger.error(f"{platform} 콘텐츠 생성 실패: {e}")
+        return {
+            platform: self._make_generation(
+                platform, content, prompt, token_share, batched=True
+            )
+            for platform, content in contents.items()
+        }
 
-        return generations
+    async def _gen_one(
+        self, platform: str, asset: Asset, transcript_result: Dict[str, Any]
+    ) -> Generation:
+        """단일 플랫폼 콘텐츠 생성"""
+        import openai
 
-    async def _validate_content(
-        self, generations: List[Generation]
-    ) -> List[QualityReport]:
-        """5차원 품질 검증"""
-        quality_reports = []
+        prompt = self._build_content_prompt(platform, asset, transcript_result)
 
-        for generation in generations:
-            try:
-                content_data = json.loads(generation.content)
+        async with self._openai_limiter:
+            response = await openai.ChatCompletion.acreate(
+                model="gpt-4",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"당신은 {platform} 플랫폼 전문 콘텐츠 크리에이터입니다.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.7,
+                max_tokens=2000,
+            )
 
-                # 품질 검증
-                report = QualityReport(
-                    id=str(uuid.uuid4()), generation_id=generation.id
-                )
+        content = response.choices[0].message.content
 
-                # Hook 점수 (30%)
-                hook_score = self._evaluate_hook(content_data)
-                report.hook_score = hook_score
+        # 생성 결과 파싱
+        parsed_content, valid = self._parse_generated_content(content, platform)
 
-                # 관련성 점수 (25%)
-                relevance_score = self._evaluate_relevance(content_data)
-                report.relevance_score = relevance_score
+        return self._make_generation(
+            platform,
+            parsed_content,
+            prompt,
+            response.usage.total_tokens if hasattr(response, "usage") else 0,
+            valid=valid,
+        )
 
-                # 가독성 점수 (20%)
-                readability_score = self._evaluate_readability(content_data)
-                report.readability_score = readability_score
+    def _make_generation(
+        self,
+        platform: str,
+        parsed_content: Dict[str, Any],
+        prompt: str,
+        token_usage: float,
+        valid: bool = True,
+        **metadata: Any,
+    ) -> Generation:
+        """파싱된 콘텐츠로 Generation 생성 (파싱 결과는 검증/발행 시 재사용)"""
+        return Generation(
+            id=str(uuid.uuid4()),
+            job_id=str(uuid.uuid4()),
+            platform=platform,
+            content_type="blog_post"
+            if platform in ["wordpress", "naver_blog"]
+            else "social_post",
+            content=json.dumps(parsed_content, ensure_ascii=False),
+            valid=valid,
+            parsed=parsed_content,
+            metadata={
+                "prompt": prompt,
+                "model": "gpt-4",
+                "token_usage": token_usage,
+                **metadata,
+            },
+        )
+
+    async def _validate_content(
+        self, generations: List[Generation]
+    ) -> Dict[str, QualityReport]:
+        """
+        5차원 품질 검증 (cpu_workers 설정 시 캐시에 없는 콘텐츠만 프로세스 풀에서 병렬 계산)
+
+        기준 점수 도달이 불가능한 콘텐츠는 본문 순회가 필요한 항목을 평가하지 않음.
+        반환: generation_id -> 품질 보고서
+        """
+        quality_reports: Dict[str, QualityReport] = {}
+
+        # JSON 추출에 실패한 생성 결과는 검증하지 않음 (발행 단계에서도 제외)
+        skipped = [generation.platform for generation in generations if not generation.valid]
+        if skipped:
+            logger.warning(f"JSON 생성 실패로 품질 검증 생략: {', '.join(skipped)}")
+        generations = [generation for generation in generations if generation.valid]
+
+        pool = self._get_cpu_pool()
+        if pool is None:
+            results = []
+            for generation in generations:
+                try:
+                    results.append(_score_all(self._content_data(generation)))
+                except Exception as e:
+                    results.append(e)
+        else:
+            # 점수 캐시는 부모 프로세스에서 조회/저장 (워커별 캐시는 재검증 시 적중하지 않음)
+            contents = [self._content_data(generation) for generation in generations]
+            fingerprints = [_fingerprint(content_data) for content_data in contents]
+            results = [_cached_scores(fingerprint) for fingerprint in fingerprints]
+            misses = [i for i, scores in enumerate(results) if scores is None]
+            if misses:
+                loop = asyncio.get_running_loop()
+                computed = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, _compute_scores, contents[i])
+                        for i in misses
+                    ),
+                    return_exceptions=True,
+                )
+                for i, scores in zip(misses, computed):
+                    if not isinstance(scores, BaseException):
+                        _cache_scores(fingerprints[i], scores)
+                    results[i] = scores
 
-                # SEO 점수 (10%)
-                seo_score = self._evaluate_seo(content_data)
-                report.seo_score = seo_score
+        for generation, scores in zip(generations, results):
+            try:
+                if isinstance(scores, BaseException):
+                    raise scores
 
-                # 독창성 점수 (15%)
-                originality_score = self._evaluate_originality(content_data)
-                report.originality_score = originality_score
+                # 품질 검증 (미평가 항목은 0점)
+                report = QualityReport(
+                    id=str(uuid.uuid4()),
+                    generation_id=generation.id,
+                    **{f"{name}_score": score for name, score in scores.items()},
+                )
 
                 # 전체 점수 (가중평균)
-                report.overall_score = (
-                    hook_score * 0.30
-                    + relevance_score * 0.25
-                    + readability_score * 0.20
-                    + seo_score * 0.10
-                    + originality_score * 0.15
+                report.overall_score = sum(
+                    scores[name] * weight
+                    for name, weight in _SCORE_WEIGHTS.items()
+                    if name in scores
                 )
 
+                skipped = [name for name in _SCORE_WEIGHTS if name not in scores]
+                if skipped:
+                    report.issues.append(
+                        f"기준 점수 도달 불가로 평가 생략: {', '.join(skipped)}"
+                    )
+
                 # 70점 미만이면 자동 재생성 플래그
-                if report.overall_score < 70:
+                if report.overall_score < _QUALITY_THRESHOLD:
                     report.auto_regenerate = True
                     report.recommendations.append(
                         "전체 점수 70점 미만으로 콘텐츠 재생성 권장"
                     )
 
-                quality_reports.append(report)
+                quality_reports[generation.id] = report
                 self.quality_reports[report.id] = report
 
                 logger.info(
@@ -671,7 +1508,7 @@ class ContentAutomationEngine:
                         asset_type=AssetType.SHORT,
                         filename=f"{asset.filename}_short_{i + 1}.mp4",
                         filepath=f"{asset.filepath}_short_{i + 1}.mp4",
-                        sha256_hash="",  # 생성 후 계산
+                        content_hash="",  # 생성 후 계산
                         file_size=0,  # 생성 후 계산
                         mime_type="video/mp4",
                         metadata={
@@ -687,7 +1524,7 @@ class ContentAutomationEngine:
                     # await self._extract_short(asset, short_asset)
 
                     shorts.append(short_asset)
-                    self.assets[short_asset.id] = short_asset
+                    self._register_asset(short_asset)
 
                     logger.info(f"Short 생성: {short_asset.filename} ({duration:.1f}s)")
 
@@ -700,64 +1537,132 @@ class ContentAutomationEngine:
         return shorts
 
     async def _publish_content(
-        self, generations: List[Generation], quality_reports: List[QualityReport]
+        self, generations: List[Generation], quality_reports: Dict[str, QualityReport]
     ) -> Dict[str, Any]:
-        """다중 플랫폼 발행"""
+        """다중 플랫폼 발행 (플랫폼 간 동시 발행, quality_reports: generation_id -> 보고서)"""
         publish_results = {}
 
-        # 품질 리포트와 생성 결과 매핑
-        quality_map = {qr.generation_id: qr for qr in quality_reports}
-
+        targets = []
         for generation in generations:
-            quality_report = quality_map.get(generation.id)
+            quality_report = quality_reports.get(generation.id)
 
             # 품질 70점 미만은 발행 생략
             if quality_report and quality_report.overall_score < 70:
                 logger.info(f"품질 미달로 발행 생략: {generation.platform}")
                 continue
 
+            if not generation.valid:
+                logger.info(f"JSON 생성 실패로 발행 생략: {generation.platform}")
+                continue
+
             if generation.platform not in self.publishers:
                 logger.warning(f"퍼블리셔 없음: {generation.platform}")
                 continue
 
-            try:
-                publisher = self.publishers[generation.platform]
-                content_data = json.loads(generation.content)
-
-                # 발행 옵션 (기본 draft 모드)
-                options = {
-                    "status": "draft",
-                    "quality_score": quality_report.overall_score
-                    if quality_report
-                    else 0,
-                }
+            targets.append((generation, quality_report))
 
-                result = await publisher.publish(content_data, options)
-                publish_results[generation.platform] = result
+        results = await asyncio.gather(
+            *(self._publish_one(generation, report) for generation, report in targets),
+            return_exceptions=True,
+        )
 
-                if result["success"]:
-                    logger.info(f"발행 성공: {generation.platform}")
-                else:
-                    logger.error(
-                        f"발행 실패: {generation.platform} - {result['error']}"
-                    )
+        for (generation, _), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"{generation.platform} 발행 중 오류: {result}")
+                result = {"success": False, "error": str(result)}
+            elif result["success"]:
+                logger.info(f"발행 성공: {generation.platform}")
+            else:
+                logger.error(f"발행 실패: {generation.platform} - {result['error']}")
 
-            except Exception as e:
-                logger.error(f"{generation.platform} 발행 중 오류: {e}")
-                publish_results[generation.platform] = {
-                    "success": False,
-                    "error": str(e),
-                }
+            publish_results[generation.platform] = result
 
         return publish_results
 
-    def _calculate_sha256(self, file_path: Path) -> str:
-        """SHA256 해시 계산"""
-        sha256_hash = hashlib.sha256()
+    async def _publish_one(
+        self, generation: Generation, quality_report: Optional[QualityReport]
+    ) -> Dict[str, Any]:
+        """단일 플랫폼 발행 (일시적 오류는 지수 백오프 + 지터로 재시도)"""
+        publisher = self.publishers[generation.platform]
+        content_data = self._content_data(generation)
+
+        # 발행 옵션 (기본 draft 모드)
+        options = {
+            "status": "draft",
+            "quality_score": quality_report.overall_score if quality_report else 0,
+        }
+
+        max_attempts = self.config.get("publish_max_attempts", 3)
+        limiter = self._publisher_limiters.get(generation.platform, nullcontext())
+
+        async with self._publish_semaphores[generation.platform]:
+            for attempt in range(max_attempts):
+                async with limiter:
+                    result = await publisher.publish(content_data, options)
+
+                if (
+                    result["success"]
+                    or not result.get("retryable")
+                    or attempt == max_attempts - 1
+                ):
+                    return result
+
+                delay = 2**attempt + random.random()
+                logger.warning(
+                    f"{generation.platform} 발행 재시도 {attempt + 1}/{max_attempts - 1} "
+                    f"({delay:.1f}초 후): {result['error']}"
+                )
+                await asyncio.sleep(delay)
+
+    def _register_asset(self, asset: Asset) -> Asset:
+        """에셋 등록 및 해시 인덱스 갱신 (동일 해시 에셋이 있으면 기존 에셋 반환)"""
+        if self._store is not None:
+            return self._store.add_asset(asset)
+
+        self.assets[asset.id] = asset
+        # 해시 미계산 에셋(생성 전 Short 등)은 인덱싱하지 않음, 동일 해시는 최초 에셋 유지
+        if asset.content_hash:
+            return self._hash_index.setdefault(asset.content_hash, asset)
+        return asset
+
+    def _get_asset(self, asset_id: str) -> Asset:
+        """ID로 에셋 조회 (없으면 KeyError)"""
+        if self._store is None:
+            return self.assets[asset_id]
+
+        asset = self._store.get_asset(asset_id)
+        if asset is None:
+            raise KeyError(asset_id)
+        return asset
+
+    def _find_asset_by_hash(self, content_hash: str) -> Optional[Asset]:
+        """내용 해시로 기존 에셋 조회"""
+        if self._store is not None:
+            return self._store.get_asset_by_hash(content_hash)
+        return self._hash_index.get(content_hash)
+
+    def _persist_job(self, job: Job):
+        """작업 상태 변경을 저장소에 반영 (메모리 모드에서는 객체 자체가 갱신되므로 불필요)"""
+        if self._store is not None:
+            self._store.save_job(job)
+
+    @staticmethod
+    def _calculate_content_hash(file_path: Path) -> str:
+        """중복 검사용 내용 해시 계산 (blake3 우선, 없으면 SHA-256)"""
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+            if blake3 is not None:
+                # 청크가 커야 blake3가 여러 코어로 병렬 해싱
+                hasher = blake3(max_threads=blake3.AUTO)
+                buffer = memoryview(bytearray(16 << 20))
+            elif hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                hasher = hashlib.sha256()
+                buffer = memoryview(bytearray(1 << 20))
+
+            while size := f.readinto(buffer):
+                hasher.update(buffer[:size])
+            return hasher.hexdigest()
 
     def _detect_asset_type(self, file_path: Path) -> AssetType:
         """에셋 유형 감지"""
@@ -778,16 +1683,67 @@ class ContentAutomationEngine:
         return mime_type or "application/octet-stream"
 
     async def _extract_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """메타데이터 추출"""
-        # FFmpeg 사용하여 비디오 메타데이터 추출
-        # 시뮬레이션된 데이터
+        """메타데이터 추출 (ffprobe 비동기 실행 - 이벤트 루프를 막지 않음)"""
+        async with self._ffprobe_semaphore:  # 동시 ffprobe 프로세스 수 제한
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "ffprobe",
+                    "-v",
+                    "error",
+                    "-print_format",
+                    "json",
+                    "-show_format",
+                    "-show_streams",
+                    str(file_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError:
+                logger.warning("ffprobe를 찾을 수 없어 시뮬레이션된 메타데이터 사용")
+                return {
+                    "duration": 600.5,  # 10분
+                    "resolution": {"width": 1920, "height": 1080},
+                    "fps": 30,
+                    "codec": "h264",
+                    "bitrate": 2500000,
+                    "format": "mp4",
+                }
+
+            stdout, stderr = await proc.communicate()
+
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"ffprobe 실패 ({proc.returncode}): {stderr.decode(errors='replace').strip()}"
+            )
+
+        info = _json_loads(stdout)
+        return self._parse_ffprobe(info)
+
+    @staticmethod
+    def _parse_ffprobe(info: Dict[str, Any]) -> Dict[str, Any]:
+        """ffprobe JSON 출력을 에셋 메타데이터 형식으로 변환"""
+        fmt = info.get("format", {})
+        streams = info.get("streams", [])
+        stream = next(
+            (s for s in streams if s.get("codec_type") == "video"),
+            streams[0] if streams else {},
+        )
+
+        fps = 0.0
+        num, _, den = stream.get("avg_frame_rate", "0/0").partition("/")
+        if den and float(den):
+            fps = round(float(num) / float(den), 3)
+
         return {
-            "duration": 600.5,  # 10분
-            "resolution": {"width": 1920, "height": 1080},
-            "fps": 30,
-            "codec": "h264",
-            "bitrate": 2500000,
-            "format": "mp4",
+            "duration": float(fmt.get("duration", 0)),
+            "resolution": {
+                "width": stream.get("width", 0),
+                "height": stream.get("height", 0),
+            },
+            "fps": fps,
+            "codec": stream.get("codec_name", ""),
+            "bitrate": int(fmt.get("bit_rate", 0)),
+            "format": fmt.get("format_name", ""),
         }
 
     def _generate_chapters(self, transcript: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -813,69 +1769,64 @@ class ContentAutomationEngine:
 
     def _generate_srt(self, transcript: Dict[str, Any]) -> str:
         """SRT 자막 생성"""
-        srt_content = []
-        segments = transcript.get("segments", [])
-
-        for i, segment in enumerate(segments):
-            start_time = self._format_timestamp(segment["start"])
-            end_time = self._format_timestamp(segment["end"])
-
-            srt_content.append(f"{i + 1}")
-            srt_content.append(f"{start_time} --> {end_time}")
-            srt_content.append(segment["text"])
-            srt_content.append("")
-
-        return "\n".join(srt_content)
+        fmt = self._format_timestamp
+        return "\n".join(
+            f"{i}\n{fmt(segment['start'])} --> {fmt(segment['end'])}\n{segment['text']}\n"
+            for i, segment in enumerate(transcript.get("segments", []), 1)
+        )
 
     def _generate_vtt(self, transcript: Dict[str, Any]) -> str:
         """WebVTT 자막 생성"""
-        vtt_content = ["WEBVTT", ""]
-        segments = transcript.get("segments", [])
-
-        for segment in segments:
-            start_time = self._format_webvtt_timestamp(segment["start"])
-            end_time = self._format_webvtt_timestamp(segment["end"])
-
-            vtt_content.append(f"{start_time} --> {end_time}")
-            vtt_content.append(segment["text"])
-            vtt_content.append("")
-
-        return "\n".join(vtt_content)
+        fmt = self._format_webvtt_timestamp
+        return "\n".join(
+            (
+                "WEBVTT\n",
+                *(
+                    f"{fmt(segment['start'])} --> {fmt(segment['end'])}\n{segment['text']}\n"
+                    for segment in transcript.get("segments", [])
+                ),
+            )
+        )
 
-    def _format_timestamp(self, seconds: float) -> str:
-        """SRT 타임스탬프 포맷팅"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+    @staticmethod
+    def _format_timestamp(seconds: float, separator: str = ",") -> str:
+        """SRT 타임스탬프 포맷팅 (밀리초 정수 연산)"""
+        hours, remainder = divmod(round(seconds * 1000), 3_600_000)
+        minutes, remainder = divmod(remainder, 60_000)
+        secs, milliseconds = divmod(remainder, 1000)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{milliseconds:03d}"
 
-    def _format_webvtt_timestamp(self, seconds: float) -> str:
+    @classmethod
+    def _format_webvtt_timestamp(cls, seconds: float) -> str:
         """WebVTT 타임스탬프 포맷팅"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+        return cls._format_timestamp(seconds, ".")
 
     def _build_content_prompt(
         self, platform: str, asset: Asset, transcript: Dict[str, Any]
     ) -> str:
-        """플랫폼별 콘텐츠 생성 프롬프트"""
-
-        platform_instructions = {
-            "wordpress": "블로그 포스팅 형식으로 작성해주세요. 제목, 본문, 태그, 카테고리를 포함해주세요.",
-            "youtube": "유튜브 영상 설명으로 작성해주세요. 타임스탬프, 관련 링크, 해시태그를 포함해주세요.",
-            "naver_blog": "네이버 블로그 포스팅으로 작성해주세요. 한국어 자연스러운 표현을 사용해주세요.",
-            "instagram": "인스타그램 캡션으로 작성해주세요. 해시태그, 짧은 문장, 이모지를 포함해주세요.",
-            "facebook": "페이스북 포스팅으로 작성해주세요. 참여를 유도하는 질문을 포함해주세요.",
-            "tiktok": "틱톡 콘텐츠로 작성해주세요. 짧고 흥미로운 문장과 해시태그를 포함해주세요.",
-        }
+        """플랫폼별 콘텐츠 생성 프롬프트 (동일 입력은 캐시된 프롬프트 재사용)"""
+        return _content_prompt(
+            platform,
+            asset.filename,
+            transcript["text"][:500],
+            transcript["word_count"],
+            len(transcript.get("chapters", [])),
+        )
 
-        instruction = platform_instructions.get(platform, "콘텐츠를 작성해주세요.")
+    def _build_batch_prompt(
+        self, platforms: List[str], asset: Asset, transcript: Dict[str, Any]
+    ) -> str:
+        """전 플랫폼 일괄 콘텐츠 생성 프롬프트"""
+
+        instructions = "\n".join(
+            f"        - {platform}: "
+            + _PLATFORM_INSTRUCTIONS.get(platform, "콘텐츠를 작성해주세요.")
+            for platform in platforms
+        )
+        example = ", ".join(f'"{platform}": {{...}}' for platform in platforms)
 
         prompt = f"""
-        다음 비디오 전사 내용을 바탕으로 {platform}용 콘텐츠를 생성해주세요.
+        다음 비디오 전사 내용을 바탕으로 아래 플랫폼별 콘텐츠를 한 번에 생성해주세요.
         
         비디오 정보:
         - 제목: {asset.filename}
@@ -883,12 +1834,13 @@ class ContentAutomationEngine:
         - 단어 수: {transcript["word_count"]}
         - 챕터: {len(transcript.get("chapters", []))}
         
-        요구사항:
-        {instruction}
+        플랫폼별 요구사항:
+{instructions}
         
         SEO 최적화를 위해 관련 키워드를 자연스럽게 포함해주세요.
         
-        JSON 형식으로 반환해주세요:
+        플랫폼 이름을 키로 하는 하나의 JSON 객체로 반환해주세요 ({example}).
+        각 플랫폼 값의 형식:
         {{
             "title": "제목",
             "body": "본문 내용",
@@ -901,234 +1853,338 @@ class ContentAutomationEngine:
 
         return prompt
 
-    def _parse_generated_content(self, content: str, platform: str) -> Dict[str, Any]:
-        """생성된 콘텐츠 파싱"""
+    def _parse_generated_content(
+        self, content: str, platform: str
+    ) -> Tuple[Dict[str, Any], bool]:
+        """생성된 콘텐츠 파싱 (반환: (콘텐츠, JSON 추출 성공 여부))"""
         try:
-            # JSON 부분 추출
-            import re
-
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                # JSON 파싱 실패 시 기본 구조
-                return {
-                    "title": f"{platform} 제목",
-                    "body": content,
-                    "tags": [],
-                    "categories": [],
-                    "summary": "",
-                    "call_to_action": "",
-                }
+            # JSON 부분 추출 - 첫 '{'부터 객체 하나만 디코딩 (코드 펜스/후행 텍스트 무시)
+            start = content.find("{")
+            if start != -1:
+                # 빠른 경로: 첫 '{' ~ 마지막 '}' 구간 전체가 객체 하나면 orjson으로 디코딩
+                # (구간 뒤에 다른 '{...}'가 붙는 등 실패하면 표준 raw_decode로 재시도)
+                if orjson is not None:
+                    try:
+                        return orjson.loads(content[start:content.rfind("}") + 1]), True
+                    except orjson.JSONDecodeError:
+                        pass
+                return _JSON_DECODER.raw_decode(content, start)[0], True
         except Exception as e:
             logger.error(f"콘텐츠 파싱 실패: {e}")
-            return {
-                "title": f"{platform} 제목",
-                "body": content,
-                "tags": [],
-                "categories": [],
-                "summary": "",
-                "call_to_action": "",
-            }
 
-    def _evaluate_hook(self, content_data: Dict[str, Any]) -> float:
-        """Hook 점수 평가"""
-        title = content_data.get("title", "")
-        summary = content_data.get("summary", "")
-
-        # Hook 단어 감지
-        hook_words = [
-            "핵심",
-            "비밀",
-            "충격",
-            "놀라운",
-            "반드시",
-            "꼭",
-            "신기",
-            "특별",
-            "혁신적",
-            "첫",
-            "마지막",
-            "최고",
-            "최악",
-            "결과",
-            "방법",
-        ]
-
-        hook_count = sum(1 for word in hook_words if word in title + summary)
-
-        # 제목 길이 최적화 (50-100자)
-        title_length_score = 1.0
-        if 50 <= len(title) <= 100:
-            title_length_score = 1.0
-        elif len(title) < 50:
-            title_length_score = len(title) / 50
-        else:
-            title_length_score = 100 / len(title)
-
-        # 종합 점수 (최대 100점)
-        hook_score = min((hook_count * 20 + title_length_score * 30), 100)
-
-        return hook_score
+        # JSON 파싱 실패 시 기본 구조
+        return {
+            "title": f"{platform} 제목",
+            "body": content,
+            "tags": [],
+            "categories": [],
+            "summary": "",
+            "call_to_action": "",
+        }, False
+
+    @staticmethod
+    def _content_data(generation: Generation) -> Dict[str, Any]:
+        """생성 결과의 콘텐츠 dict (생성 시 파싱 결과 재사용, 저장소에서 읽은 경우 파싱)"""
+        if generation.parsed is None:
+            generation.parsed = _json_loads(generation.content)
+        return generation.parsed
+
+    @staticmethod
+    def _evaluate_all(
+        content_data: Dict[str, Any], early_exit: bool = False
+    ) -> Dict[str, float]:
+        """
+        5차원 품질 점수 일괄 계산 (필드 조회/길이 계산/텍스트 순회를 항목 간에 공유)
 
-    def _evaluate_relevance(self, content_data: Dict[str, Any]) -> float:
-        """관련성 점수 평가"""
-        required_fields = ["title", "body"]
-        present_fields = sum(1 for field in required_fields if content_data.get(field))
+        필드 존재 여부와 길이만으로 계산되는 관련성/SEO를 먼저 구하고,
+        early_exit이면 나머지가 모두 100점이어도 기준 점수에 못 미칠 때
+        본문 순회가 필요한 Hook/가독성/독창성 평가를 생략 (반환 dict에서 제외)
+        """
+        view = ContentView.build(content_data)
+        title, body, summary = view.title, view.body, view.summary
+        tags, categories = view.tags, view.categories
+        title_length, body_length = view.title_length, view.body_length
 
-        # 본문 길이 최적화
-        body = content_data.get("body", "")
-        body_length_score = min(len(body) / 500, 1.0)  # 500자 기준
+        # 관련성: 필수 필드 완성도 / 본문 길이 / 구조 완성도
+        present_fields = bool(title) + bool(body)
+        body_length_score = min(body_length / 500, 1.0)  # 500자 기준
 
-        # 구조 완성도
         structure_score = 0
-        if "tags" in content_data and content_data["tags"]:
+        if tags:
             structure_score += 20
-        if "categories" in content_data and content_data["categories"]:
+        if categories:
             structure_score += 20
-        if "summary" in content_data and content_data["summary"]:
+        if summary:
             structure_score += 10
 
         relevance_score = min(
-            (present_fields / len(required_fields)) * 40  # 필드 완성도 (40점)
+            (present_fields / 2) * 40  # 필드 완성도 (40점)
             + body_length_score * 30  # 본문 길이 (30점)
             + structure_score,  # 구조 (30점)
             100,
         )
 
-        return relevance_score
+        # SEO: 제목 (30점) / 메타 설명 (20점) / 태그 (30점) / 키워드 밀도 (20점)
+        seo_score = 0
+        if title:
+            seo_score += 30
+        if summary and len(summary) > 50:
+            seo_score += 20
+        if len(tags) >= 3:
+            seo_score += 30
+        if body:
+            # 간단한 키워드 밀도 계산
+            seo_score += 20
+        seo_score = min(seo_score, 100)
+
+        scores = {"relevance": relevance_score, "seo": seo_score}
+        if early_exit:
+            max_possible = (
+                relevance_score * _SCORE_WEIGHTS["relevance"]
+                + seo_score * _SCORE_WEIGHTS["seo"]
+                + 100 * (1 - _SCORE_WEIGHTS["relevance"] - _SCORE_WEIGHTS["seo"])
+            )
+            if max_possible < _QUALITY_THRESHOLD:
+                return scores
 
-    def _evaluate_readability(self, content_data: Dict[str, Any]) -> float:
-        """가독성 점수 평가"""
-        body = content_data.get("body", "")
+        # Hook: 제목+요약의 Hook 단어 종류 수 / 제목 길이 최적화 (50-100자)
+        hook_count = ContentAutomationEngine._hook_count(title + summary)
+
+        # 최적 제목 길이 50-100자 (분기 없이: 50 미만은 L/50, 100 초과는 100/L이 최솟값)
+        title_length_score = min(1.0, title_length / 50, 100 / (title_length or 1))
 
+        scores["hook"] = min((hook_count * 20 + title_length_score * 30), 100)
+
+        # 가독성: 영어 본문은 textstat, 그 외는 문장 길이 / 문단 구조
         if not body:
-            return 0.0
+            readability_score = 0.0
+        else:
+            readability_score = _textstat_readability(body)
+            if readability_score is None:
+                avg_sentence_length, paragraph_count = _readability_features(body)
+
+                # 최적 문장 길이 15-25 단어 (제목 길이 점수와 같은 분기 없는 형태)
+                sentence_score = min(
+                    1.0, avg_sentence_length / 15, 25 / (avg_sentence_length or 1)
+                )
+
+                # 문단 구조 (최소 3 문단)
+                paragraph_score = min(paragraph_count / 3, 1.0)
+
+                readability_score = min(
+                    (sentence_score * 0.5 + paragraph_score * 0.5) * 100, 100
+                )
+        scores["readability"] = readability_score
+
+        # 독창성: 일반적 표현 감점 / 길이 보너스 (최대 20점) / 구조적 다양성
+        # 표현은 토큰 단위가 아닌 부분 문자열로 센다 - 조사/문장부호가 붙은 형태
+        # ("여러분께", "매우,")도 감점 대상이어야 하므로 공백 토큰 Counter로는 대체 불가
+        penalty = 5 * ContentAutomationEngine._common_phrase_count(title + body)
+
+        length_bonus = min(body_length / 1000, 20)
+
+        structure_bonus = 0
+        if "###" in body:
+            structure_bonus += 10  # 제목 사용
+        if "**" in body:
+            structure_bonus += 10  # 강조 사용
 
-        # 문장 길이 분석
-        sentences = body.split(".")
-        avg_sentence_length = (
-            sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0
+        scores["originality"] = min(
+            max(0, 100 - penalty + length_bonus + structure_bonus), 100
         )
 
-        # 최적 문장 길이 15-25 단어
-        sentence_score = 1.0
-        if 15 <= avg_sentence_length <= 25:
-            sentence_score = 1.0
-        elif avg_sentence_length < 15:
-            sentence_score = avg_sentence_length / 15
-        else:
-            sentence_score = 25 / avg_sentence_length
+        return scores
 
-        # 문단 구조
-        paragraphs = [p for p in body.split("\n\n") if p.strip()]
-        paragraph_score = min(len(paragraphs) / 3, 1.0)  # 최소 3 문단
+    @staticmethod
+    def _hook_count(text: str) -> int:
+        """텍스트에 포함된 Hook 단어 종류 수"""
+        if _HOOK_AUTOMATON is not None:
+            return len({index for _, index in _HOOK_AUTOMATON.iter(text)})
+        return sum(1 for word in ContentAutomationEngine.HOOK_WORDS if word in text)
 
-        # 혼합 평가
-        readability_score = (sentence_score * 0.5 + paragraph_score * 0.5) * 100
+    @staticmethod
+    def _common_phrase_count(text: str) -> int:
+        """텍스트에 등장한 일반적 표현 횟수"""
+        if _COMMON_AUTOMATON is not None:
+            return sum(1 for _ in _COMMON_AUTOMATON.iter(text))
+        return len(_COMMON_PHRASES_RE.findall(text))
 
-        return min(readability_score, 100)
+    @staticmethod
+    def evaluate_batch(items: List[Dict[str, Any]]) -> "np.ndarray":
+        """
+        콘텐츠 N개 품질 점수 일괄 계산 (반환: (N, 5) 배열, 열 순서는 _SCORE_WEIGHTS)
 
-    def _evaluate_seo(self, content_data: Dict[str, Any]) -> float:
-        """SEO 점수 평가"""
-        title = content_data.get("title", "")
-        tags = content_data.get("tags", [])
-        body = content_data.get("body", "")
+        텍스트 순회(Hook 단어/일반적 표현/가독성 특징)만 항목별로 하고
+        길이 점수/가산점/상한 처리는 배열 연산으로 한 번에 계산 (_evaluate_all과 동일 결과)
+        """
+        if np is None:
+            raise ImportError("numpy 패키지가 필요합니다")
+
+        n = len(items)
+        title_lengths = np.zeros(n)
+        body_lengths = np.zeros(n)
+        summary_lengths = np.zeros(n)
+        tag_counts = np.zeros(n)
+        has_categories = np.zeros(n, dtype=bool)
+        hook_counts = np.zeros(n)
+        phrase_counts = np.zeros(n)
+        structure_bonus = np.zeros(n)
+        textstat_scores = np.full(n, np.nan)
+        avg_sentence_lengths = np.zeros(n)
+        paragraph_counts = np.zeros(n)
+
+        for i, content_data in enumerate(items):
+            view = ContentView.build(content_data)
+            title, body, summary = view.title, view.body, view.summary
+            title_lengths[i] = view.title_length
+            body_lengths[i] = view.body_length
+            summary_lengths[i] = len(summary)
+            tag_counts[i] = len(view.tags)
+            has_categories[i] = bool(view.categories)
+            hook_counts[i] = ContentAutomationEngine._hook_count(title + summary)
+            phrase_counts[i] = ContentAutomationEngine._common_phrase_count(title + body)
+            structure_bonus[i] = 10 * ("###" in body) + 10 * ("**" in body)
+            if body:
+                readability = _textstat_readability(body)
+                if readability is not None:
+                    textstat_scores[i] = readability
+                else:
+                    avg_sentence_lengths[i], paragraph_counts[i] = _readability_features(body)
 
-        score = 0
+        has_title, has_body, has_summary = title_lengths > 0, body_lengths > 0, summary_lengths > 0
 
-        # 제목에 키워드 (30점)
-        if title and len(title) > 0:
-            score += 30
+        title_length_score = np.minimum(
+            1.0, np.minimum(title_lengths / 50, 100 / np.maximum(title_lengths, 1))
+        )
+        hook = np.minimum(hook_counts * 20 + title_length_score * 30, 100)
 
-        # 메타 설명 (20점)
-        summary = content_data.get("summary", "")
-        if summary and len(summary) > 50:
-            score += 20
+        relevance = np.minimum(
+            (has_title.astype(np.int64) + has_body) / 2 * 40
+            + np.minimum(body_lengths / 500, 1.0) * 30
+            + (20 * (tag_counts > 0) + 20 * has_categories + 10 * has_summary),
+            100,
+        )
 
-        # 태그 (30점)
-        if tags and len(tags) >= 3:
-            score += 30
+        sentence_score = np.minimum(
+            1.0,
+            np.minimum(
+                avg_sentence_lengths / 15,
+                25 / np.where(avg_sentence_lengths == 0, 1, avg_sentence_lengths),
+            ),
+        )
+        paragraph_score = np.minimum(paragraph_counts / 3, 1.0)
+        readability = np.where(
+            np.isnan(textstat_scores),
+            np.minimum((sentence_score * 0.5 + paragraph_score * 0.5) * 100, 100),
+            textstat_scores,
+        )
+        readability[~has_body] = 0.0
 
-        # 키워드 밀도 (20점)
-        if body and len(body) > 0:
-            # 간단한 키워드 밀도 계산
-            score += 20
+        seo = np.minimum(
+            30 * has_title + 20 * (summary_lengths > 50) + 30 * (tag_counts >= 3) + 20 * has_body,
+            100,
+        )
 
-        return min(score, 100)
+        originality = np.minimum(
+            np.maximum(
+                0,
+                100 - 5 * phrase_counts + np.minimum(body_lengths / 1000, 20) + structure_bonus,
+            ),
+            100,
+        )
 
-    def _evaluate_originality(self, content_data: Dict[str, Any]) -> float:
-        """독창성 점수 평가"""
-        title = content_data.get("title", "")
-        body = content_data.get("body", "")
-
-        # 일반적 표현 감지 (감점 요소)
-        common_phrases = [
-            "오늘은",
-            "안녕하세요",
-            "많은 분들이",
-            "궁금해하시는",
-            "여러분",
-            "정말로",
-            "매우",
-            "아주",
-            "매우",
-        ]
+        columns = {
+            "hook": hook,
+            "relevance": relevance,
+            "readability": readability,
+            "seo": seo,
+            "originality": originality,
+        }
+        return np.column_stack([columns[name] for name in _SCORE_WEIGHTS])
 
-        penalty = 0
-        for phrase in common_phrases:
-            penalty += (title + body).count(phrase) * 5
+    @staticmethod
+    def _evaluate_hook(content_data: Dict[str, Any]) -> float:
+        """Hook 점수 평가"""
+        return ContentAutomationEngine._evaluate_all(content_data)["hook"]
 
-        # 길이 기반 독창성
-        length_bonus = min(len(body) / 1000, 20)  # 최대 20점 보너스
+    @staticmethod
+    def _evaluate_relevance(content_data: Dict[str, Any]) -> float:
+        """관련성 점수 평가"""
+        return ContentAutomationEngine._evaluate_all(content_data)["relevance"]
 
-        # 구조적 다양성
-        structure_bonus = 0
-        if "###" in body:
-            structure_bonus += 10  # 제목 사용
-        if "**" in body:
-            structure_bonus += 10  # 강조 사용
+    @staticmethod
+    def _evaluate_readability(content_data: Dict[str, Any]) -> float:
+        """가독성 점수 평가"""
+        return ContentAutomationEngine._evaluate_all(content_data)["readability"]
+
+    @staticmethod
+    def _evaluate_seo(content_data: Dict[str, Any]) -> float:
+        """SEO 점수 평가"""
+        return ContentAutomationEngine._evaluate_all(content_data)["seo"]
 
-        originality_score = max(0, 100 - penalty + length_bonus + structure_bonus)
+    @staticmethod
+    def _evaluate_originality(content_data: Dict[str, Any]) -> float:
+        """독창성 점수 평가"""
+        return ContentAutomationEngine._evaluate_all(content_data)["originality"]
+
+    @staticmethod
+    def _highlight_counts(text: str) -> Tuple[int, int]:
+        """세그먼트 텍스트의 (하이라이트 키워드 종류 수, 감정 키워드 종류 수)"""
+        if _HIGHLIGHT_AUTOMATON is not None:
+            # 한 번 순회로 하이라이트/감정 키워드 종류 수 집계
+            found = {value for _, value in _HIGHLIGHT_AUTOMATON.iter(text)}
+            keyword_count = sum(1 for kind, _ in found if kind == "keyword")
+            return keyword_count, len(found) - keyword_count
+
+        # 하이라이트 감지 키워드 수
+        keyword_count = sum(
+            1 for keyword in ContentAutomationEngine.HIGHLIGHT_KEYWORDS if keyword in text
+        )
 
-        return min(originality_score, 100)
+        # 감정 강도 (간단한 구현)
+        emotion_count = sum(
+            1 for keyword in ContentAutomationEngine.EMOTION_KEYWORDS if keyword in text
+        )
+
+        return keyword_count, emotion_count
 
     def _detect_highlights(self, transcript: Dict[str, Any]) -> List[Dict[str, Any]]:
         """하이라이트 감지"""
         highlights = []
         segments = transcript.get("segments", [])
+        if _HIGHLIGHT_CASE_SENSITIVE:
+            counts = [self._highlight_counts(segment["text"].lower()) for segment in segments]
+        else:
+            counts = [self._highlight_counts(segment["text"]) for segment in segments]
 
-        for segment in segments:
-            text = segment["text"].lower()
-
-            # 하이라이트 키워드
-            highlight_keywords = [
-                "핵심",
-                "중요",
-                "결론",
-                "결과",
-                "성공",
-                "실패",
-                "문제",
-                "해결",
-                "방법",
-                "팁",
-                "꿀팁",
-                "충격",
-                "놀라",
-                "신기",
-                "특별",
-                "첫",
-                "마지막",
+        if np is not None and len(segments) >= _VECTORIZE_MIN_SEGMENTS:
+            # 세그먼트가 많으면 점수를 배열(SoA)로 계산하고 통과한 세그먼트만 dict로 변환
+            keyword_counts = np.fromiter(
+                (keyword_count for keyword_count, _ in counts), np.int32, len(counts)
+            )
+            emotion_counts = np.fromiter(
+                (emotion_count for _, emotion_count in counts), np.int32, len(counts)
+            )
+            if _score_segments_numba is not None:
+                mask, scores = _score_segments_numba(keyword_counts, emotion_counts)
+                keep = np.flatnonzero(mask)
+            else:
+                scores = keyword_counts * 10 + emotion_counts * 5
+                keep = np.flatnonzero(scores >= 10)
+
+            # 점수 내림차순 (동점은 원래 순서 유지 - list.sort와 동일)
+            ranked = keep[np.argsort(-scores[keep], kind="stable")]
+            return [
+                {
+                    "start_time": segments[i]["start"],
+                    "end_time": segments[i]["end"],
+                    "text": segments[i]["text"],
+                    "score": int(scores[i]),
+                }
+                for i in ranked
             ]
 
-            # 하이라이트 감지 키워드 수
-            keyword_count = sum(1 for keyword in highlight_keywords if keyword in text)
-
-            # 감정 강도 (간단한 구현)
-            emotion_keywords = ["!", "?", "정말", "매우", "아주"]
-            emotion_count = sum(1 for keyword in emotion_keywords if keyword in text)
-
+        for segment, (keyword_count, emotion_count) in zip(segments, counts):
             # 하이라이트 점수
             highlight_score = keyword_count * 10 + emotion_count * 5
 
@@ -1149,18 +2205,129 @@ class ContentAutomationEngine:
         return highlights
 
 
-# 글로벌 엔진 인스턴스
+# 평가 키워드 오토마톤/정규식 (모듈 로드 시 1회 생성 - 프로세스 풀 워커도 동일)
+# 값: Hook 단어 인덱스 / 표현 인덱스 / (종류, 인덱스)
+_HOOK_AUTOMATON = _build_automaton(
+    {word: i for i, word in enumerate(ContentAutomationEngine.HOOK_WORDS)}
+)
+_COMMON_AUTOMATON = _build_automaton(
+    {phrase: i for i, phrase in enumerate(ContentAutomationEngine.COMMON_PHRASES)}
+)
+_COMMON_PHRASES_RE = re.compile(_trie_pattern(ContentAutomationEngine.COMMON_PHRASES))
+_HIGHLIGHT_AUTOMATON = _build_automaton(
+    {
+        **{
+            keyword: ("keyword", i)
+            for i, keyword in enumerate(ContentAutomationEngine.HIGHLIGHT_KEYWORDS)
+        },
+        **{
+            keyword: ("emotion", i)
+            for i, keyword in enumerate(ContentAutomationEngine.EMOTION_KEYWORDS)
+        },
+    }
+)
+# 하이라이트/감정 키워드가 모두 한글/문장부호(대소문자 없음)면 세그먼트 소문자 변환 생략
+_HIGHLIGHT_CASE_SENSITIVE = any(
+    keyword.upper() != keyword.lower()
+    for keyword in (
+        ContentAutomationEngine.HIGHLIGHT_KEYWORDS + ContentAutomationEngine.EMOTION_KEYWORDS
+    )
+)
+
+
+# 품질 점수 캐시 (콘텐츠 지문 -> 항목별 점수, 프로세스 단위 LRU)
+_SCORE_CACHE_SIZE = 4096
+_SCORE_CACHE: "OrderedDict[bytes, Dict[str, float]]" = OrderedDict()
+
+
+def _fingerprint(content_data: Dict[str, Any]) -> bytes:
+    """평가에 쓰이는 필드(제목/본문/요약/태그/카테고리)의 blake2b 지문"""
+    hasher = hashlib.blake2b(digest_size=16)
+    for key in ("title", "body", "summary", "tags", "categories"):
+        value = content_data.get(key)
+        if isinstance(value, str):
+            hasher.update(b"s")
+            hasher.update(value.encode())
+        else:
+            hasher.update(b"r")
+            hasher.update(repr(value).encode())
+        hasher.update(b"\x00")
+    return hasher.digest()
+
+
+def _cached_scores(fingerprint: bytes) -> Optional[Dict[str, float]]:
+    """지문으로 캐시된 점수 조회 (LRU 갱신)"""
+    scores = _SCORE_CACHE.get(fingerprint)
+    if scores is not None:
+        _SCORE_CACHE.move_to_end(fingerprint)
+    return scores
+
+
+def _cache_scores(fingerprint: bytes, scores: Dict[str, float]):
+    """점수 캐시 저장 (초과 시 가장 오래된 항목 제거)"""
+    _SCORE_CACHE[fingerprint] = scores
+    if len(_SCORE_CACHE) > _SCORE_CACHE_SIZE:
+        _SCORE_CACHE.popitem(last=False)
+
+
+def _compute_scores(content_data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    생성 콘텐츠의 품질 항목별 점수 계산 (기준 점수 도달 불가 시 일부 항목 생략)
+
+    ProcessPoolExecutor로 전달되므로 pickle 가능한 모듈 레벨 순수 함수로 둔다.
+    """
+    return ContentAutomationEngine._evaluate_all(content_data, early_exit=True)
+
+
+def _score_all(content_data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    품질 항목별 점수 (인라인 실행용)
+    재생성/재검증으로 같은 콘텐츠가 다시 들어오면 지문으로 캐시된 점수를 사용.
+    """
+    fingerprint = _fingerprint(content_data)
+    scores = _cached_scores(fingerprint)
+    if scores is None:
+        scores = _compute_scores(content_data)
+        _cache_scores(fingerprint, scores)
+    return scores
+
+
+# 프로세스 기본 엔진 (기존 호출부 호환용 이름 유지)
 content_engine: Optional[ContentAutomationEngine] = None
 
+# 요청/태스크 단위 엔진 (설정되지 않은 컨텍스트는 기본 엔진 사용)
+# 앱 시작 시 설정한 값은 요청 처리 컨텍스트로 전파되지 않을 수 있으므로 기본 엔진을 함께 둔다
+_engine_var: ContextVar[Optional[ContentAutomationEngine]] = ContextVar(
+    "content_engine", default=None
+)
+
 
 def initialize_content_automation(config: Dict[str, Any]) -> ContentAutomationEngine:
-    """콘텐츠 자동화 엔진 초기화"""
+    """콘텐츠 자동화 엔진 초기화 (기본 엔진 + 현재 컨텍스트 엔진으로 등록)"""
     global content_engine
-    content_engine = ContentAutomationEngine(config)
+    engine = ContentAutomationEngine(config)
+    content_engine = engine
+    _engine_var.set(engine)
+    _warm_up_kernels()
     logger.info("콘텐츠 자동화 엔진 초기화 완료")
-    return content_engine
+    return engine
+
+
+def set_content_engine(engine: Optional[ContentAutomationEngine]) -> Token:
+    """
+    현재 컨텍스트(요청/태스크)에서만 사용할 엔진 지정
+
+    반환된 토큰을 reset_content_engine에 넘기면 이전 엔진으로 복원
+    """
+    return _engine_var.set(engine)
+
+
+def reset_content_engine(token: Token) -> None:
+    """set_content_engine 이전의 컨텍스트 엔진으로 복원"""
+    _engine_var.reset(token)
 
 
 def get_content_engine() -> Optional[ContentAutomationEngine]:
-    """콘텐츠 자동화 엔진 인스턴스 획득"""
-    return content_engine
+    """콘텐츠 자동화 엔진 인스턴스 획득 (컨텍스트 엔진 우선, 없으면 기본 엔진)"""
+    engine = _engine_var.get()
+    return engine if engine is not None else content_engine